@@ -2,13 +2,19 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
+import json
+import os
 import sys
 from pathlib import Path
+from typing import Any
 
+from eudr_dmi_gil.deps.hansen_acquire import resolve_hansen_url_template
 from eudr_dmi_gil.deps.hansen_bootstrap import (
     ensure_hansen_for_aoi,
     hansen_tiles_root,
 )
+from eudr_dmi_gil.deps.hansen_tiles import loads_geojson
 from eudr_dmi_gil.io import data_plane
 
 
@@ -16,7 +22,77 @@ def _parse_layers(value: str) -> list[str]:
     return [part.strip() for part in value.split(",") if part.strip()]
 
 
-def main() -> int:
+def _manifest_cache_path() -> Path:
+    return data_plane.external_root() / ".cache" / "hansen_manifest.json"
+
+
+def _manifest_cache_key(
+    aoi_id: str, aoi_bytes: bytes, layers: list[str], *, download: bool, offline: bool
+) -> str:
+    aoi_digest = hashlib.sha256(aoi_bytes).hexdigest()
+    return "|".join(
+        [
+            aoi_id,
+            aoi_digest,
+            ",".join(sorted(set(layers))),
+            f"download={int(download)}",
+            f"offline={int(offline)}",
+            resolve_hansen_url_template(),
+        ]
+    )
+
+
+def _load_manifest_cache(cache_path: Path) -> dict[str, Any]:
+    try:
+        cache = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (FileNotFoundError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _cached_manifest(cache: dict[str, Any], key: str, aoi_geojson: Path) -> Path | None:
+    """Return the cached manifest path if it is still usable.
+
+    The manifest path is shared by every run for the same AOI id, so the file
+    must still hash to the digest recorded for this key (i.e. no later run
+    with other inputs has rewritten it). It must also be newer than the AOI
+    file, and every tile it lists must still be present locally.
+    """
+
+    cached = cache.get(key)
+    if not isinstance(cached, dict):
+        return None
+    manifest_path = Path(str(cached.get("manifest_path", "")))
+    try:
+        if manifest_path.stat().st_mtime < aoi_geojson.stat().st_mtime:
+            return None
+        manifest_bytes = manifest_path.read_bytes()
+        if hashlib.sha256(manifest_bytes).hexdigest() != cached.get("manifest_sha256"):
+            return None
+        manifest = json.loads(manifest_bytes)
+    except (OSError, ValueError):
+        return None
+    for entry in manifest.get("entries", []):
+        local_path = entry.get("local_path") if isinstance(entry, dict) else None
+        if not isinstance(local_path, str) or not Path(local_path).is_file():
+            return None
+    return manifest_path
+
+
+def _store_manifest_cache(
+    cache_path: Path, cache: dict[str, Any], key: str, manifest_path: Path
+) -> None:
+    cache[key] = {
+        "manifest_path": str(manifest_path),
+        "manifest_sha256": hashlib.sha256(manifest_path.read_bytes()).hexdigest(),
+    }
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps(cache, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    os.replace(tmp_path, cache_path)
+
+
+def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(
         description="Ensure Hansen tiles are available for a given AOI"
     )
@@ -36,7 +112,7 @@ def main() -> int:
     parser.add_argument(
         "--minio-cache",
         action="store_true",
-        help="Enable MinIO cache for tiles and manifest",
+        help="Enable MinIO cache for tiles and manifest (bypasses the local manifest cache)",
     )
     parser.add_argument(
         "--offline",
@@ -48,21 +124,50 @@ def main() -> int:
         action="store_true",
         help="Print resolved external root and tiles directory",
     )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Ignore the local manifest cache and re-run tile resolution",
+    )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
+    aoi_geojson = Path(args.aoi_geojson)
+    layers = _parse_layers(args.layers)
 
-    try:
-        manifest_path = ensure_hansen_for_aoi(
-            aoi_id=args.aoi_id,
-            aoi_geojson_path=Path(args.aoi_geojson),
-            layers=_parse_layers(args.layers),
-            download=args.download,
-            minio_cache_enabled=args.minio_cache,
-            offline=args.offline,
+    # Read the AOI once: the bytes key the manifest cache and are decoded here
+    # so ensure_hansen_for_aoi does not parse the file again. MinIO runs always
+    # resolve tiles so the manifest is uploaded.
+    aoi_bytes: bytes | None = None
+    cache_path = cache_key = None
+    cache: dict[str, Any] = {}
+    manifest_path: Path | None = None
+    if aoi_geojson.is_file():
+        aoi_bytes = aoi_geojson.read_bytes()
+    if aoi_bytes is not None and not args.minio_cache:
+        cache_path = _manifest_cache_path()
+        cache_key = _manifest_cache_key(
+            args.aoi_id, aoi_bytes, layers, download=args.download, offline=args.offline
         )
-    except Exception as exc:  # noqa: BLE001
-        print(f"ERROR: {exc}", file=sys.stderr)
-        return 2
+        cache = _load_manifest_cache(cache_path)
+        if not args.refresh:
+            manifest_path = _cached_manifest(cache, cache_key, aoi_geojson)
+
+    if manifest_path is None:
+        try:
+            manifest_path = ensure_hansen_for_aoi(
+                aoi_id=args.aoi_id,
+                aoi_geojson_path=aoi_geojson,
+                layers=layers,
+                download=args.download,
+                minio_cache_enabled=args.minio_cache,
+                offline=args.offline,
+                aoi_geojson=loads_geojson(aoi_bytes) if aoi_bytes is not None else None,
+            )
+        except Exception as exc:  # noqa: BLE001
+            print(f"ERROR: {exc}", file=sys.stderr)
+            return 2
+        if cache_path is not None and cache_key is not None:
+            _store_manifest_cache(cache_path, cache, cache_key, manifest_path)
 
     if args.print_paths:
         print(f"external_root={data_plane.external_root()}")
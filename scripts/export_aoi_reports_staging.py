@@ -1,13 +1,30 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+import errno
 import json
 import os
 import shutil
+import stat
+import sys
+import threading
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+from jinja2 import DictLoader, Environment, Template
+
+from eudr_dmi.reports.io import dumps_json_indented
+
+try:  # Optional speed-up
+    import orjson  # type: ignore[import-not-found]
+
+    _HAS_ORJSON = True
+except Exception:
+    _HAS_ORJSON = False
+
 REPO_ROOT = Path(__file__).resolve().parent.parent
 EVIDENCE_ROOT_DEFAULT = REPO_ROOT / "audit" / "evidence"
 OUTPUT_ROOT_DEFAULT = REPO_ROOT / "out" / "site_bundle" / "aoi_reports"
@@ -23,215 +40,359 @@ class RunEntry:
     summary_present: bool
 
 
+@dataclass(frozen=True)
+class ReportView:
+    """The subset of an AOI report that the portable report.html reads."""
+
+    aoi_id: str
+    bundle_id: str
+    generated_at_utc: str
+    forest_metrics: dict[str, Any]
+    tiles_manifest_relpaths: tuple[str, ...]
+    computed_tiles_manifest_relpaths: tuple[str, ...]
+
+
+def _report_view(report: dict[str, Any]) -> ReportView:
+    tiles_manifests: list[str] = []
+    for dep in report.get("external_dependencies", []) or []:
+        if not isinstance(dep, dict):
+            continue
+        tiles_manifest = dep.get("tiles_manifest", {}).get("relpath")
+        if isinstance(tiles_manifest, str):
+            tiles_manifests.append(tiles_manifest)
+
+    computed_manifests: list[str] = []
+    for output in (report.get("computed_outputs") or {}).values():
+        if not isinstance(output, dict):
+            continue
+        tiles_ref = output.get("tiles_manifest_ref", {})
+        if isinstance(tiles_ref, dict):
+            relpath = tiles_ref.get("relpath")
+            if isinstance(relpath, str):
+                computed_manifests.append(relpath)
+
+    forest_metrics = report.get("forest_metrics", {})
+    return ReportView(
+        aoi_id=report.get("aoi_id", "(unknown)"),
+        bundle_id=report.get("bundle_id", "(unknown)"),
+        generated_at_utc=report.get("generated_at_utc", "(unknown)"),
+        forest_metrics=forest_metrics if isinstance(forest_metrics, dict) else {},
+        tiles_manifest_relpaths=tuple(tiles_manifests),
+        computed_tiles_manifest_relpaths=tuple(computed_manifests),
+    )
+
+
 def _load_json(path: Path) -> dict[str, Any]:
+    if _HAS_ORJSON:
+        return orjson.loads(path.read_bytes())
     return json.loads(path.read_text(encoding="utf-8"))
 
 
+_WRITE_BUFFER_SIZE = 1 << 16
+
+
+def _write_json(path: Path, payload: Any) -> None:
+    path.write_bytes(dumps_json_indented(payload))
+
+
+def _write_template(path: Path, template: Template, **context: Any) -> None:
+    # Stream rendered chunks straight to disk; the page is never held as one str.
+    with open(path, "wb", buffering=_WRITE_BUFFER_SIZE) as fh:
+        template.stream(**context).dump(fh, encoding="utf-8")
+
+
+_COPY_FALLBACK_ERRNOS = frozenset(
+    {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.ETXTBSY}
+)
+
+
+def _try_stat(path: Path) -> os.stat_result | None:
+    try:
+        return os.stat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+def _fast_copy(src: Path, dest: Path, st: os.stat_result | None = None) -> None:
+    """Copy ``src`` to ``dest`` with mtime and mode, like ``shutil.copy2``.
+
+    Uses ``os.copy_file_range`` where available so the kernel copies (or
+    reflinks, on CoW filesystems) without bouncing bytes through userspace.
+    Python 3.14+ already does this inside ``shutil.copy2``. Pass the source
+    ``st`` when the caller has already stat'ed it to avoid re-stat'ing.
+    """
+
+    if sys.version_info >= (3, 14) or not hasattr(os, "copy_file_range"):
+        shutil.copy2(src, dest)
+        return
+
+    if st is None:
+        st = os.stat(src)
+    try:
+        with src.open("rb") as fsrc, dest.open("wb") as fdst:
+            remaining = st.st_size
+            while remaining > 0:
+                copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+    except OSError as exc:
+        if exc.errno not in _COPY_FALLBACK_ERRNOS:
+            raise
+        shutil.copyfile(src, dest)
+    os.utime(dest, ns=(st.st_atime_ns, st.st_mtime_ns))
+    os.chmod(dest, stat.S_IMODE(st.st_mode))
+
+
+def _copy_files(copies: list[tuple[Path, Path, os.stat_result]]) -> None:
+    """Copy ``(src, dest, src_stat)`` entries concurrently.
+
+    Copies are I/O-bound and release the GIL, so threads overlap them. Each
+    destination must appear at most once and its parent must already exist.
+    """
+
+    if len(copies) <= 1:
+        for src, dest, st in copies:
+            _fast_copy(src, dest, st)
+        return
+
+    max_workers = min(32, (os.cpu_count() or 1) * 4, len(copies))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for _ in executor.map(lambda entry: _fast_copy(*entry), copies):
+            pass
+
+
+_REPORT_VERSIONS = ("aoi_report_v2", "aoi_report_v1")
+
+
+def _find_report_jsons(evidence_root: Path) -> dict[str, list[Path]]:
+    """Find ``reports/<version>/*.json`` anywhere under ``evidence_root``.
+
+    Matches what ``rglob("reports/<version>/*.json")`` finds for each version,
+    but in a single ``os.scandir`` walk that reuses cached ``DirEntry`` types
+    and never descends into ``reports/`` subtrees (tiles, rasters, maps).
+    """
+
+    found: dict[str, list[Path]] = {version: [] for version in _REPORT_VERSIONS}
+    pending = [evidence_root]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as it:
+                # Like rglob, never recurse through directory symlinks (which
+                # could loop or alias a subtree); a symlinked `reports` itself
+                # is still matched, as rglob's literal path segment would be.
+                subdirs = [
+                    entry
+                    for entry in it
+                    if entry.is_dir(follow_symlinks=False)
+                    or (entry.name == "reports" and entry.is_dir())
+                ]
+        except (FileNotFoundError, NotADirectoryError, PermissionError):
+            continue
+        for entry in subdirs:
+            if entry.name != "reports":
+                pending.append(Path(entry.path))
+                continue
+            for version in _REPORT_VERSIONS:
+                try:
+                    with os.scandir(os.path.join(entry.path, version)) as it:
+                        found[version].extend(
+                            Path(f.path) for f in it if f.name.endswith(".json") and f.is_file()
+                        )
+                except (FileNotFoundError, NotADirectoryError, PermissionError):
+                    continue
+    return {version: sorted(paths) for version, paths in found.items()}
+
+
 def _ensure_single_staged_run(output_root: Path, *, run_id: str) -> None:
     runs_dir = output_root / "runs"
     if not runs_dir.is_dir():
         raise SystemExit(f"Runs dir not found: {runs_dir}")
 
-    run_dirs = [p for p in runs_dir.iterdir() if p.is_dir()]
+    with os.scandir(runs_dir) as it:
+        run_dirs = [entry.name for entry in it if entry.is_dir(follow_symlinks=False)]
     if len(run_dirs) != 1:
         raise SystemExit(f"Expected exactly one run dir under {runs_dir}, found {len(run_dirs)}")
 
-    if run_dirs[0].name != run_id:
-      raise SystemExit(f"Expected only '{run_id}' run dir, found: {run_dirs[0].name}")
-
+    if run_dirs[0] != run_id:
+      raise SystemExit(f"Expected only '{run_id}' run dir, found: {run_dirs[0]}")
 
-def _render_index(entry: RunEntry, *, report_json_filename: str) -> str:
-    summary_link = (
-        f' <span class="muted">(</span><a href="runs/{entry.run_id}/summary.json">summary.json</a>'
-        f'<span class="muted">)</span>'
-        if entry.summary_present
-        else ""
-    )
-    rows = (
-        f'<li><a href="runs/{entry.run_id}/report.html">{entry.run_id}</a> '
-      f'<span class="muted">(</span><a href="runs/{entry.run_id}/{report_json_filename}">{report_json_filename}</a>'
-        f'<span class="muted">)</span>{summary_link}</li>'
-    )
 
-    return f"""<!doctype html>
-<html lang=\"en\">
+# Shared page chrome (CSS + nav). Each page still inlines it: the Digital Twin
+# publish tools copy runs/<run_id>/ individually, so a sibling stylesheet
+# would not travel with the published report.
+_BASE_TMPL_SOURCE = """<!doctype html>
+<html lang="en">
 <head>
-  <meta charset=\"utf-8\" />
-  <meta name=\"viewport\" content=\"width=device-width, initial-scale=1\" />
-  <title>AOI Reports</title>
+  <meta charset="utf-8" />
+  <meta name="viewport" content="width=device-width, initial-scale=1" />
+  <title>{% block title %}{% endblock %}</title>
   <style>
-    :root {{ --fg:#111; --bg:#fff; --muted:#666; --card:#f6f7f9; --link:#0b5fff; }}
-    body {{ font-family: ui-sans-serif, system-ui, -apple-system, Segoe UI, Roboto, Helvetica, Arial, sans-serif;
-           color: var(--fg); background: var(--bg); margin: 0; }}
-    header {{ border-bottom: 1px solid #e7e7e7; background: #fff; position: sticky; top: 0; }}
-    .wrap {{ max-width: 980px; margin: 0 auto; padding: 16px 20px; }}
-    nav a {{ margin-right: 14px; text-decoration: none; color: var(--link); font-weight: 600; }}
-    nav a.active {{ color: var(--fg); }}
-    main {{ padding: 18px 20px 40px; }}
-    h1 {{ margin: 0 0 6px; font-size: 22px; }}
-    p {{ line-height: 1.5; }}
-    .muted {{ color: var(--muted); }}
-    .card {{ background: var(--card); border: 1px solid #e8eaee; border-radius: 12px; padding: 14px 14px; }}
-    ul {{ padding-left: 18px; }}
+    :root { --fg:#111; --bg:#fff; --muted:#666; --card:#f6f7f9; --link:#0b5fff; }
+    body { font-family: ui-sans-serif, system-ui, -apple-system, Segoe UI, Roboto, Helvetica, Arial, sans-serif;
+           color: var(--fg); background: var(--bg); margin: 0; }
+    header { border-bottom: 1px solid #e7e7e7; background: #fff; position: sticky; top: 0; }
+    .wrap { max-width: 980px; margin: 0 auto; padding: 16px 20px; }
+    nav a { margin-right: 14px; text-decoration: none; color: var(--link); font-weight: 600; }
+    nav a.active { color: var(--fg); }
+    main { padding: 18px 20px 40px; }
+    h1 { margin: 0 0 6px; font-size: 22px; }
+    p { line-height: 1.5; }
+    .muted { color: var(--muted); }
+    .card { background: var(--card); border: 1px solid #e8eaee; border-radius: 12px; padding: 14px 14px; }
+    ul { padding-left: 18px; }
+    {% block extra_css %}{% endblock %}
   </style>
 </head>
 <body>
   <header>
-    <div class=\"wrap\">
+    <div class="wrap">
       <nav>
-        <a href=\"../index.html\">Home</a>
-        <a href=\"../articles/index.html\">Articles</a>
-        <a href=\"../dependencies/index.html\">Dependencies</a>
-        <a href=\"../regulation/links.html\">Regulation</a>
-        <a href=\"../regulation/sources.html\">Sources</a>
-        <a href=\"../regulation/policy_to_evidence_spine.html\">Spine</a>
-        <a href=\"../views/index.html\">Views</a>
-        <a href=\"index.html\" class=\"active\">AOI Reports</a>
-        <a href=\"../dao_stakeholders/index.html\">DAO (Stakeholders)</a>
-        <a href=\"../dao_dev/index.html\">DAO (Developers)</a>
+        <a href="{{ site_root }}index.html">Home</a>
+        <a href="{{ site_root }}articles/index.html">Articles</a>
+        <a href="{{ site_root }}dependencies/index.html">Dependencies</a>
+        <a href="{{ site_root }}regulation/links.html">Regulation</a>
+        <a href="{{ site_root }}regulation/sources.html">Sources</a>
+        <a href="{{ site_root }}regulation/policy_to_evidence_spine.html">Spine</a>
+        <a href="{{ site_root }}views/index.html">Views</a>
+        <a href="{{ aoi_root }}index.html" class="active">AOI Reports</a>
+        <a href="{{ site_root }}dao_stakeholders/index.html">DAO (Stakeholders)</a>
+        <a href="{{ site_root }}dao_dev/index.html">DAO (Developers)</a>
       </nav>
     </div>
   </header>
   <main>
-    <div class=\"wrap\">
-      <h1>AOI Reports</h1>
-      <p class=\"muted\">Portable bundle. Links assume this folder is mounted at <code>docs/site/bundles/</code>.</p>
-      <div class=\"card\">
-        <h2>Runs</h2>
-        <ul>
-          {rows or '<li>(none)</li>'}
-        </ul>
-      </div>
+    <div class="wrap">
+{% block content %}{% endblock %}
     </div>
   </main>
 </body>
 </html>
 """
 
+_INDEX_TMPL_SOURCE = """{% extends "base.html" %}
+{% block title %}AOI Reports{% endblock %}
+{% block content %}
+      <h1>AOI Reports</h1>
+      <p class="muted">Portable bundle. Links assume this folder is mounted at <code>docs/site/bundles/</code>.</p>
+      <div class="card">
+        <h2>Runs</h2>
+        <ul>
+{% for entry in entries %}
+          <li><a href="runs/{{ entry.run_id }}/report.html">{{ entry.run_id }}</a> \
+<span class="muted">(</span><a href="runs/{{ entry.run_id }}/{{ report_json_filename }}">{{ report_json_filename }}</a>\
+<span class="muted">)</span>
+{%- if entry.summary_present %} <span class="muted">(</span><a href="runs/{{ entry.run_id }}/summary.json">summary.json</a>\
+<span class="muted">)</span>{% endif %}</li>
+{% else %}
+          <li>(none)</li>
+{% endfor %}
+        </ul>
+      </div>
+{% endblock %}
+"""
 
-def _render_report_html(report: dict[str, Any], *, rel_artifacts: list[str]) -> str:
-    aoi_id = report.get("aoi_id", "(unknown)")
-    bundle_id = report.get("bundle_id", "(unknown)")
-    generated = report.get("generated_at_utc", "(unknown)")
-    forest_metrics = report.get("forest_metrics", {})
-
-    def _link(label: str, relpath: str) -> str:
-        return (
-            f'<li><a href="{relpath}">{label}</a> '
-            f'<span class="muted">({relpath})</span></li>'
-        )
-
-    links: list[str] = []
-    for relpath in rel_artifacts:
-        if relpath.endswith(f"reports/aoi_report_v2/{aoi_id}.html"):
-            links.append(_link("Rendered AOI report (HTML)", relpath))
-        if relpath.endswith(f"reports/aoi_report_v2/{aoi_id}.json"):
-            links.append(_link("AOI report JSON", relpath))
-        if relpath.endswith(f"reports/aoi_report_v2/{aoi_id}/metrics.csv"):
-            links.append(_link("Metrics CSV", relpath))
-        if relpath.endswith("inputs/aoi.geojson") or relpath.endswith("inputs/aoi.wkt"):
-            links.append(_link("AOI geometry", relpath))
-
-    for dep in report.get("external_dependencies", []) or []:
-        if not isinstance(dep, dict):
-            continue
-        tiles_manifest = dep.get("tiles_manifest", {}).get("relpath")
-        if isinstance(tiles_manifest, str):
-            links.append(_link("Hansen tiles manifest", tiles_manifest))
-
-    for output in (report.get("computed_outputs") or {}).values():
-        if not isinstance(output, dict):
-            continue
-        tiles_ref = output.get("tiles_manifest_ref", {})
-        if isinstance(tiles_ref, dict):
-            relpath = tiles_ref.get("relpath")
-            if isinstance(relpath, str):
-                links.append(_link("Tiles manifest (computed)", relpath))
-
-    if not links:
-        links = ["<li>(none)</li>"]
-
-    links_html = "\n".join(links)
-
-    forest_rows: list[str] = []
-    if isinstance(forest_metrics, dict) and forest_metrics:
-      loss_recent = forest_metrics.get("loss_2021_2024_ha")
-      loss_recent_pct = forest_metrics.get("loss_2021_2024_pct_of_rfm")
-      forest_rows.extend(
-        [
-          f"<li><b>Tree cover threshold (%):</b> {forest_metrics.get('canopy_threshold_pct')}</li>",
-          f"<li><b>RFM area (ha):</b> {forest_metrics.get('rfm_area_ha')}</li>",
-          f"<li><b>Loss 2021–2024 (ha):</b> {loss_recent} ({loss_recent_pct}% of RFM)</li>",
-          f"<li><b>Forest end-year area (ha):</b> {forest_metrics.get('forest_end_year_area_ha')}</li>",
-        ]
-      )
-    forest_html = "\n".join(forest_rows) if forest_rows else "<li>(none)</li>"
-
-    return f"""<!doctype html>
-<html lang=\"en\">
-<head>
-  <meta charset=\"utf-8\" />
-  <meta name=\"viewport\" content=\"width=device-width, initial-scale=1\" />
-  <title>AOI Report — {aoi_id}</title>
-  <style>
-    :root {{ --fg:#111; --bg:#fff; --muted:#666; --card:#f6f7f9; --link:#0b5fff; }}
-    body {{ font-family: ui-sans-serif, system-ui, -apple-system, Segoe UI, Roboto, Helvetica, Arial, sans-serif;
-           color: var(--fg); background: var(--bg); margin: 0; }}
-    header {{ border-bottom: 1px solid #e7e7e7; background: #fff; position: sticky; top: 0; }}
-    .wrap {{ max-width: 980px; margin: 0 auto; padding: 16px 20px; }}
-    nav a {{ margin-right: 14px; text-decoration: none; color: var(--link); font-weight: 600; }}
-    nav a.active {{ color: var(--fg); }}
-    main {{ padding: 18px 20px 40px; }}
-    h1 {{ margin: 0 0 6px; font-size: 22px; }}
-    p {{ line-height: 1.5; }}
-    .muted {{ color: var(--muted); }}
-    .card {{ background: var(--card); border: 1px solid #e8eaee; border-radius: 12px; padding: 14px 14px; }}
-    ul {{ padding-left: 18px; }}
-    code {{ background: #f1f1f1; padding: 1px 4px; border-radius: 6px; }}
-  </style>
-</head>
-<body>
-  <header>
-    <div class=\"wrap\">
-      <nav>
-        <a href=\"../../../index.html\">Home</a>
-        <a href=\"../../../articles/index.html\">Articles</a>
-        <a href=\"../../../dependencies/index.html\">Dependencies</a>
-        <a href=\"../../../regulation/links.html\">Regulation</a>
-        <a href=\"../../../regulation/sources.html\">Sources</a>
-        <a href=\"../../../regulation/policy_to_evidence_spine.html\">Spine</a>
-        <a href=\"../../../views/index.html\">Views</a>
-        <a href=\"../../index.html\" class=\"active\">AOI Reports</a>
-        <a href=\"../../../dao_stakeholders/index.html\">DAO (Stakeholders)</a>
-        <a href=\"../../../dao_dev/index.html\">DAO (Developers)</a>
-      </nav>
-    </div>
-  </header>
-  <main>
-    <div class=\"wrap\">
-      <p class=\"muted\"><a href=\"../../index.html\">Back to AOI runs</a></p>
+_REPORT_TMPL_SOURCE = """{% extends "base.html" %}
+{% block title %}AOI Report — {{ view.aoi_id }}{% endblock %}
+{% block extra_css %}    code { background: #f1f1f1; padding: 1px 4px; border-radius: 6px; }
+{% endblock %}
+{% block content %}
+      <p class="muted"><a href="../../index.html">Back to AOI runs</a></p>
       <h1>AOI Report</h1>
-      <p><b>AOI</b>: <code>{aoi_id}</code><br />
-         <b>Bundle</b>: <code>{bundle_id}</code><br />
-         <b>Generated (UTC)</b>: <code>{generated}</code></p>
-      <div class=\"card\">
+      <p><b>AOI</b>: <code>{{ view.aoi_id }}</code><br />
+         <b>Bundle</b>: <code>{{ view.bundle_id }}</code><br />
+         <b>Generated (UTC)</b>: <code>{{ view.generated_at_utc }}</code></p>
+      <div class="card">
         <h2>Artifacts</h2>
         <ul>
-          {links_html}
+{% for label, relpath in links %}
+          <li><a href="{{ relpath }}">{{ label }}</a> <span class="muted">({{ relpath }})</span></li>
+{% else %}
+          <li>(none)</li>
+{% endfor %}
         </ul>
       </div>
       <div class="card" style="margin-top:16px;">
         <h2>Forest area and loss (pixel-based, AOI intersection)</h2>
         <ul>
-          {forest_html}
+{% set fm = view.forest_metrics %}
+{% if fm %}
+          <li><b>Tree cover threshold (%):</b> {{ fm.get("canopy_threshold_pct") }}</li>
+          <li><b>RFM area (ha):</b> {{ fm.get("rfm_area_ha") }}</li>
+          <li><b>Loss 2021–2024 (ha):</b> {{ fm.get("loss_2021_2024_ha") }} \
+({{ fm.get("loss_2021_2024_pct_of_rfm") }}% of RFM)</li>
+          <li><b>Forest end-year area (ha):</b> {{ fm.get("forest_end_year_area_ha") }}</li>
+{% else %}
+          <li>(none)</li>
+{% endif %}
         </ul>
       </div>
-    </div>
-  </main>
-</body>
-</html>
+{% endblock %}
 """
 
+_ENV = Environment(
+    loader=DictLoader(
+        {
+            "base.html": _BASE_TMPL_SOURCE,
+            "index.html": _INDEX_TMPL_SOURCE,
+            "report.html": _REPORT_TMPL_SOURCE,
+        }
+    ),
+    autoescape=True,
+    trim_blocks=True,
+    lstrip_blocks=True,
+    keep_trailing_newline=True,
+)
+_INDEX_TMPL = _ENV.get_template("index.html", globals={"site_root": "../", "aoi_root": ""})
+_REPORT_TMPL = _ENV.get_template(
+    "report.html", globals={"site_root": "../../../", "aoi_root": "../../"}
+)
+
+
+def _write_index(
+    path: Path, entries: Iterable[RunEntry], *, report_json_filename: str
+) -> None:
+    """Stream index.html, consuming ``entries`` lazily.
+
+    Each row is rendered and flushed to disk as its entry is pulled, so a
+    generator of runs is never materialized as a list or as one big string.
+    """
+
+    _write_template(
+        path, _INDEX_TMPL, entries=entries, report_json_filename=report_json_filename
+    )
+
+
+_AOI_GEOMETRY_SUFFIXES = ("inputs/aoi.geojson", "inputs/aoi.wkt")
+
+
+def _artifact_links(view: ReportView, rel_artifacts: list[str]) -> list[tuple[str, str]]:
+    report_prefix = f"reports/aoi_report_v2/{view.aoi_id}"
+    # The suffixes are mutually exclusive, so the first match wins.
+    labelled_suffixes = (
+        (f"{report_prefix}.html", "Rendered AOI report (HTML)"),
+        (f"{report_prefix}.json", "AOI report JSON"),
+        (f"{report_prefix}/metrics.csv", "Metrics CSV"),
+        (_AOI_GEOMETRY_SUFFIXES, "AOI geometry"),
+    )
+    links: list[tuple[str, str]] = []
+    for relpath in rel_artifacts:
+        for suffix, label in labelled_suffixes:
+            if relpath.endswith(suffix):
+                links.append((label, relpath))
+                break
+
+    for relpath in view.tiles_manifest_relpaths:
+        links.append(("Hansen tiles manifest", relpath))
+
+    for relpath in view.computed_tiles_manifest_relpaths:
+        links.append(("Tiles manifest (computed)", relpath))
+    return links
+
+
+def _write_report_html(path: Path, view: ReportView, *, rel_artifacts: list[str]) -> None:
+    _write_template(path, _REPORT_TMPL, view=view, links=_artifact_links(view, rel_artifacts))
+
 
 def export_aoi_reports(
   *,
@@ -239,14 +400,64 @@ def export_aoi_reports(
   output_root: Path,
   staged_run_id: str,
   report_json_filename: str,
+) -> threading.Thread | None:
+    """Stage the single AOI report run under ``output_root``.
+
+    The tree is built in a sibling temp directory and swapped in with
+    ``os.rename``, so readers never see a half-written export and a failed
+    run leaves the previous output untouched. The replaced tree is deleted
+    on a background thread, which is returned (``None`` when nothing was
+    replaced) so callers can join it.
+    """
+
+    build_root = output_root.with_name(f"{output_root.name}.tmp.{os.getpid()}")
+    replaced_root = output_root.with_name(f"{output_root.name}.old.{os.getpid()}")
+    for stale in (build_root, replaced_root):
+        # Left behind by an earlier run that was killed mid-export.
+        if stale.exists():
+            shutil.rmtree(stale)
+    build_root.mkdir(parents=True)
+    try:
+        _build_staging_tree(
+            evidence_root=evidence_root,
+            output_root=build_root,
+            staged_run_id=staged_run_id,
+            report_json_filename=report_json_filename,
+        )
+        had_output = output_root.exists()
+        if had_output:
+            os.rename(output_root, replaced_root)
+        try:
+            os.rename(build_root, output_root)
+        except BaseException:
+            if had_output:
+                os.rename(replaced_root, output_root)
+            raise
+    except BaseException:
+        shutil.rmtree(build_root, ignore_errors=True)
+        raise
+
+    if not had_output:
+        return None
+    cleanup = threading.Thread(
+        target=shutil.rmtree, args=(replaced_root,), kwargs={"ignore_errors": True}
+    )
+    cleanup.start()
+    return cleanup
+
+
+def _build_staging_tree(
+  *,
+  evidence_root: Path,
+  output_root: Path,
+  staged_run_id: str,
+  report_json_filename: str,
 ) -> None:
-    if output_root.exists():
-        shutil.rmtree(output_root)
-    output_root.mkdir(parents=True, exist_ok=True)
 
-    report_jsons = sorted(evidence_root.rglob("reports/aoi_report_v2/*.json"))
+    found_reports = _find_report_jsons(evidence_root)
+    report_jsons = found_reports["aoi_report_v2"]
     if not report_jsons:
-      report_jsons = sorted(evidence_root.rglob("reports/aoi_report_v1/*.json"))
+      report_jsons = found_reports["aoi_report_v1"]
 
     if len(report_jsons) != 1:
         raise SystemExit(
@@ -262,14 +473,11 @@ def export_aoi_reports(
     run_dir = output_root / "runs" / staged_run_id
     run_dir.mkdir(parents=True, exist_ok=True)
 
-    rel_artifacts: list[str] = []
-    rel_artifacts_set: set[str] = set()
+    # Insertion-ordered set of staged relpaths.
+    rel_artifacts: dict[str, None] = {}
 
     def _add_relpath(relpath: str) -> None:
-      if relpath in rel_artifacts_set:
-        return
-      rel_artifacts.append(relpath)
-      rel_artifacts_set.add(relpath)
+      rel_artifacts[relpath] = None
 
     # Copy declared input artefacts into run dir (preserve relative paths)
     input_relpaths: set[str] = set()
@@ -283,80 +491,97 @@ def export_aoi_reports(
       if isinstance(uri, str) and uri:
         input_relpaths.add(uri)
 
+    extensions = report.get("extensions") if isinstance(report.get("extensions"), dict) else {}
+    params_payload = extensions.get("forest_metrics_params") if isinstance(extensions, dict) else None
+    debug_payload = extensions.get("forest_metrics_debug") if isinstance(extensions, dict) else None
+
+    # Files written below from the report itself. They always win over a copied
+    # artifact with the same relpath, so those copies are never scheduled (the
+    # copies run concurrently with the writes).
+    generated_relpaths = {report_json_filename, "report.html"}
+    if isinstance(params_payload, dict):
+      generated_relpaths.add("forest_metrics_params.json")
+    if isinstance(debug_payload, dict):
+      generated_relpaths.add("forest_metrics_debug.json")
+
+    # Plan every copy up front (drops duplicate destinations), create the
+    # unique parent dirs once, then copy concurrently.
+    planned: dict[str, tuple[Path, Path, os.stat_result]] = {}
+
+    def _plan_copy(src: Path, dest: Path) -> str | None:
+      st = _try_stat(src)
+      if st is None:
+        return None
+      dest_relpath = dest.relative_to(run_dir).as_posix()
+      if dest_relpath not in generated_relpaths:
+        planned.setdefault(dest_relpath, (src, dest, st))
+      return dest_relpath
+
+    staged_relpaths: list[str] = []
     for relpath in sorted(input_relpaths):
-      src = bundle_root / relpath
-      if not src.exists():
-        continue
-      dest = run_dir / relpath
-      dest.parent.mkdir(parents=True, exist_ok=True)
-      shutil.copy2(src, dest)
-      _add_relpath(dest.relative_to(run_dir).as_posix())
+      staged = _plan_copy(bundle_root / relpath, run_dir / relpath)
+      if staged is not None:
+        staged_relpaths.append(staged)
 
     # Copy evidence artifacts into run dir (preserve relative paths)
     for artifact in report.get("evidence_artifacts", []):
         relpath = artifact.get("relpath")
         if not relpath:
             continue
-        src = bundle_root / relpath
-        if not src.exists():
-            continue
-        dest = run_dir / relpath
-        dest.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(src, dest)
-        _add_relpath(dest.relative_to(run_dir).as_posix())
-
-    # Write canonical report JSON name
-    extensions = report.get("extensions") if isinstance(report.get("extensions"), dict) else {}
-    params_payload = extensions.get("forest_metrics_params") if isinstance(extensions, dict) else None
-    debug_payload = extensions.get("forest_metrics_debug") if isinstance(extensions, dict) else None
-    artifacts_block: dict[str, str] = {}
-
-    if isinstance(params_payload, dict):
-      params_path = run_dir / "forest_metrics_params.json"
-      params_path.write_text(
-        json.dumps(params_payload, indent=2, sort_keys=True) + "\n",
-        encoding="utf-8",
-      )
-      _add_relpath(params_path.relative_to(run_dir).as_posix())
-      artifacts_block["params_ref"] = params_path.name
-
-    if isinstance(debug_payload, dict):
-      debug_path = run_dir / "forest_metrics_debug.json"
-      debug_path.write_text(
-        json.dumps(debug_payload, indent=2, sort_keys=True) + "\n",
-        encoding="utf-8",
-      )
-      _add_relpath(debug_path.relative_to(run_dir).as_posix())
-      artifacts_block["debug_ref"] = debug_path.name
-
-    if artifacts_block:
-      report.setdefault("extensions", {})["forest_metrics_artifacts"] = artifacts_block
-
-    report_json_out = run_dir / report_json_filename
-    report_json_out.write_text(
-        json.dumps(report, indent=2, sort_keys=True) + "\n", encoding="utf-8"
-    )
-    if report_json_filename not in rel_artifacts_set:
-      rel_artifacts.insert(0, report_json_filename)
-      rel_artifacts_set.add(report_json_filename)
-
-    # Render a portable report.html (relative links)
-    report_html_out = run_dir / "report.html"
-    report_html_out.write_text(
-        _render_report_html(report, rel_artifacts=rel_artifacts), encoding="utf-8"
-    )
+        staged = _plan_copy(bundle_root / relpath, run_dir / relpath)
+        if staged is not None:
+            staged_relpaths.append(staged)
 
     # Include rendered report HTML/JSON and metrics.csv if present
+    rendered_relpaths: list[str] = []
     rendered_html = report_root / f"{report.get('aoi_id')}.html"
     rendered_json = report_root / f"{report.get('aoi_id')}.json"
     metrics_csv = report_root / report.get("aoi_id", "") / "metrics.csv"
     for src in [rendered_html, rendered_json, metrics_csv]:
-      if not src.exists():
-        continue
-      dest = run_dir / src.relative_to(bundle_root)
-      dest.parent.mkdir(parents=True, exist_ok=True)
-      shutil.copy2(src, dest)
-      _add_relpath(dest.relative_to(run_dir).as_posix())
+      staged = _plan_copy(src, run_dir / src.relative_to(bundle_root))
+      if staged is not None:
+        rendered_relpaths.append(staged)
+
+    for dest_dir in sorted({dest.parent for _, dest, _ in planned.values()}):
+      dest_dir.mkdir(parents=True, exist_ok=True)
+    for staged in staged_relpaths:
+      _add_relpath(staged)
+
+    # The copies are I/O-bound and release the GIL; run them in the background
+    # while this thread does the CPU-bound JSON encoding and HTML rendering.
+    with ThreadPoolExecutor(max_workers=1) as background:
+      copies_done = background.submit(_copy_files, list(planned.values()))
+
+      # Write canonical report JSON name
+      artifacts_block: dict[str, str] = {}
+
+      if isinstance(params_payload, dict):
+        params_path = run_dir / "forest_metrics_params.json"
+        _write_json(params_path, params_payload)
+        _add_relpath(params_path.relative_to(run_dir).as_posix())
+        artifacts_block["params_ref"] = params_path.name
+
+      if isinstance(debug_payload, dict):
+        debug_path = run_dir / "forest_metrics_debug.json"
+        _write_json(debug_path, debug_payload)
+        _add_relpath(debug_path.relative_to(run_dir).as_posix())
+        artifacts_block["debug_ref"] = debug_path.name
+
+      if artifacts_block:
+        report.setdefault("extensions", {})["forest_metrics_artifacts"] = artifacts_block
+
+      report_json_out = run_dir / report_json_filename
+      _write_json(report_json_out, report)
+      if report_json_filename not in rel_artifacts:
+        rel_artifacts = {report_json_filename: None, **rel_artifacts}
+
+      # Render a portable report.html (relative links)
+      report_html_out = run_dir / "report.html"
+      _write_report_html(report_html_out, _report_view(report), rel_artifacts=list(rel_artifacts))
+      copies_done.result()
+
+    for staged in rendered_relpaths:
+      _add_relpath(staged)
 
     summary_present = (run_dir / "summary.json").is_file()
     entry = RunEntry(
@@ -365,8 +590,7 @@ def export_aoi_reports(
         report_json_path=report_json_out,
         summary_present=summary_present,
     )
-    index_html = _render_index(entry, report_json_filename=report_json_filename)
-    (output_root / "index.html").write_text(index_html, encoding="utf-8")
+    _write_index(output_root / "index.html", [entry], report_json_filename=report_json_filename)
 
     _ensure_single_staged_run(output_root, run_id=staged_run_id)
 
@@ -385,13 +609,15 @@ def main() -> int:
     if Path(report_json_filename).name != report_json_filename:
         raise SystemExit("EUDR_DMI_AOI_REPORT_JSON_FILENAME must be a filename, not a path")
 
-    export_aoi_reports(
+    cleanup = export_aoi_reports(
         evidence_root=evidence_root,
         output_root=output_root,
         staged_run_id=staged_run_id,
         report_json_filename=report_json_filename,
     )
     print(str(output_root))
+    if cleanup is not None:
+        cleanup.join()
     return 0
 
 
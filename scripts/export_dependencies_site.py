@@ -5,6 +5,8 @@ from __future__ import annotations
 
 import argparse
 import html
+import re
+from collections.abc import Callable
 from pathlib import Path
 
 
@@ -25,67 +27,101 @@ def resolve_under_repo(rel: Path) -> Path:
     return resolved
 
 
-def _render_markdown_basic(text: str) -> str:
-    lines = text.splitlines()
-    html_lines: list[str] = []
-    in_code = False
-    in_list = False
-
-    def close_list() -> None:
-        nonlocal in_list
-        if in_list:
-            html_lines.append("</ul>")
-            in_list = False
-
-    for raw in lines:
-        line = raw.rstrip("\n")
-        if line.strip().startswith("```"):
-            if in_code:
-                html_lines.append("</code></pre>")
-                in_code = False
-            else:
-                close_list()
-                html_lines.append("<pre><code>")
-                in_code = True
-            continue
+_HEADING_RE = re.compile(r"^(#{1,3}) (.*)$")
+_LIST_RE = re.compile(r"^[-*] (.*)$")
 
-        if in_code:
-            html_lines.append(html.escape(line))
-            continue
 
-        if line.startswith("# "):
-            close_list()
-            html_lines.append(f"<h1>{html.escape(line[2:].strip())}</h1>")
-            continue
-        if line.startswith("## "):
-            close_list()
-            html_lines.append(f"<h2>{html.escape(line[3:].strip())}</h2>")
-            continue
-        if line.startswith("### "):
-            close_list()
-            html_lines.append(f"<h3>{html.escape(line[4:].strip())}</h3>")
-            continue
+def _heading_block(line: str) -> tuple[str, str] | None:
+    match = _HEADING_RE.match(line)
+    if match is None:
+        return None
+    return f"h{len(match.group(1))}", match.group(2).strip()
 
-        if line.startswith("- ") or line.startswith("* "):
-            if not in_list:
-                html_lines.append("<ul>")
-                in_list = True
-            html_lines.append(f"<li>{html.escape(line[2:].strip())}</li>")
-            continue
 
-        if not line.strip():
-            close_list()
-            html_lines.append("<p></p>")
+def _list_item_block(line: str) -> tuple[str, str] | None:
+    match = _LIST_RE.match(line)
+    if match is None:
+        return None
+    return "li", match.group(1).strip()
+
+
+# Line classifiers keyed on the first character of the line; each returns the
+# block kind and its text, or None to fall through to a paragraph line.
+_LINE_HANDLERS: dict[str, Callable[[str], tuple[str, str] | None]] = {
+    "#": _heading_block,
+    "-": _list_item_block,
+    "*": _list_item_block,
+}
+
+
+def _render_markdown_basic(text: str) -> str:
+    """Render headings, lists, fenced code and paragraphs to HTML.
+
+    Lines are grouped into blocks first; each block is escaped and formatted in
+    one go. Consecutive text lines form one paragraph, and blank lines separate
+    blocks.
+    """
+
+    blocks: list[str] = []
+    paragraph: list[str] = []
+    items: list[str] = []
+    code: list[str] | None = None
+
+    def flush() -> None:
+        if paragraph:
+            escaped = html.escape("\n".join(paragraph))
+            blocks.append(f"<p>{escaped}</p>")
+            paragraph.clear()
+        if items:
+            rendered = "\n".join(f"<li>{html.escape(item)}</li>" for item in items)
+            blocks.append(f"<ul>\n{rendered}\n</ul>")
+            items.clear()
+
+    def code_block(lines: list[str]) -> str:
+        if not lines:
+            return "<pre><code>\n</code></pre>"
+        escaped = html.escape("\n".join(lines))
+        return f"<pre><code>\n{escaped}\n</code></pre>"
+
+    for line in text.splitlines():
+        stripped = line.strip()
+        if stripped.startswith("```"):
+            if code is None:
+                flush()
+                code = []
+            else:
+                blocks.append(code_block(code))
+                code = None
             continue
 
-        close_list()
-        html_lines.append(f"<p>{html.escape(line.strip())}</p>")
+        if code is not None:
+            code.append(line)
+            continue
 
-    close_list()
-    if in_code:
-        html_lines.append("</code></pre>")
+        if not stripped:
+            flush()
+            continue
 
-    return "\n".join(html_lines)
+        handler = _LINE_HANDLERS.get(line[:1])
+        block = handler(line) if handler is not None else None
+        if block is None:
+            if items:
+                flush()
+            paragraph.append(stripped)
+        elif block[0] == "li":
+            if paragraph:
+                flush()
+            items.append(block[1])
+        else:
+            flush()
+            kind, content = block
+            blocks.append(f"<{kind}>{html.escape(content)}</{kind}>")
+
+    flush()
+    if code is not None:
+        blocks.append(code_block(code))
+
+    return "\n".join(blocks)
 
 
 def _wrap_html(title: str, body_html: str, *, nav_html: str) -> str:
@@ -361,9 +361,10 @@ def main(argv: list[str] | None = None) -> int:
     report_html = out_dir / "report.html"
     report_pdf = out_dir / "report.pdf"
 
-    write_json_stable(report_json, report.to_dict())
-    render_report_html(report, report_html)
-    render_report_pdf(report, report_pdf)
+    payload = report.to_dict()
+    write_json_stable(report_json, payload)
+    render_report_html(report, report_html, payload=payload)
+    render_report_pdf(report, report_pdf, payload=payload)
     write_manifest_sha256(out_dir, report.artifacts)
 
     print(out_dir)
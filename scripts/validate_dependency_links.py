@@ -9,13 +9,48 @@ import sys
 import time
 import urllib.error
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
+from urllib.parse import urljoin
+
+from eudr_dmi.reports.io import dumps_json_indented
+
+try:  # Optional: pooled keep-alive connections (urllib3 ships with the minio client)
+    import urllib3  # type: ignore[import-not-found]
+
+    _HAS_URLLIB3 = True
+except Exception:
+    _HAS_URLLIB3 = False
 
 CONNECT_TIMEOUT = 10
 READ_TIMEOUT = 20
 RETRIES = 1
+DEFAULT_WORKERS = 16
+# Bodies at most this large are drained so the connection can be reused;
+# anything larger (e.g. a server ignoring Range) is closed instead.
+_DRAIN_LIMIT_BYTES = 64 * 1024
+
+# One pool for the whole run, so repeat hosts reuse their TCP/TLS connection.
+_POOL = (
+    urllib3.PoolManager(
+        num_pools=32,
+        maxsize=DEFAULT_WORKERS,
+        timeout=urllib3.Timeout(connect=CONNECT_TIMEOUT, read=READ_TIMEOUT),
+        # `total` would also cap redirects, so only connect/read errors are retried.
+        retries=urllib3.Retry(
+            total=None,
+            connect=RETRIES,
+            read=RETRIES,
+            redirect=10,
+            backoff_factor=0.2,
+            raise_on_status=False,
+        ),
+    )
+    if _HAS_URLLIB3
+    else None
+)
 
 
 def repo_root() -> Path:
@@ -63,8 +98,32 @@ def _read_limited(response: urllib.response.addinfourl) -> None:
     response.read(1024)
 
 
-def _try_head(url: str) -> tuple[int, str, dict[str, str]]:
-    req = urllib.request.Request(url, method="HEAD")
+def _pooled_request(
+    method: str, url: str, headers: dict[str, str]
+) -> tuple[int, str, dict[str, str]]:
+    response = _POOL.request(method, url, headers=headers, preload_content=False)
+    try:
+        if method == "GET":
+            response.read(1024)
+        remaining = response.length_remaining
+        if remaining is not None and remaining <= _DRAIN_LIMIT_BYTES:
+            response.drain_conn()
+        else:
+            response.close()
+        # Resolve the redirect chain; response.geturl() is path-only here.
+        final_url = url
+        for hop in getattr(response.retries, "history", ()):
+            if hop.redirect_location:
+                final_url = urljoin(final_url, hop.redirect_location)
+        return response.status, final_url, {k.lower(): v for k, v in response.headers.items()}
+    finally:
+        response.release_conn()
+
+
+def _try_head(url: str, headers: dict[str, str] | None = None) -> tuple[int, str, dict[str, str]]:
+    if _POOL is not None:
+        return _pooled_request("HEAD", url, dict(headers or {}))
+    req = urllib.request.Request(url, headers=dict(headers or {}), method="HEAD")
     response = _request_with_retries(req)
     status = getattr(response, "status", 200)
     final_url = response.geturl()
@@ -72,31 +131,72 @@ def _try_head(url: str) -> tuple[int, str, dict[str, str]]:
     return status, final_url, headers
 
 
-def _try_get_range(url: str) -> tuple[int, str, dict[str, str]]:
-    req = urllib.request.Request(url, method="GET")
+def _try_get_range(
+    url: str, headers: dict[str, str] | None = None
+) -> tuple[int, str, dict[str, str]]:
+    if _POOL is not None:
+        return _pooled_request("GET", url, {**(headers or {}), "Range": "bytes=0-1024"})
+    req = urllib.request.Request(url, headers=dict(headers or {}), method="GET")
     req.add_header("Range", "bytes=0-1024")
     response = _request_with_retries(req)
     status = getattr(response, "status", 200)
     final_url = response.geturl()
     headers = {k.lower(): v for k, v in response.headers.items()}
-    _read_limited(response)
+    if status != 304:
+        _read_limited(response)
     return status, final_url, headers
 
 
-def _check_url(url: str) -> tuple[int | None, str, dict[str, str]]:
+def _check_url(
+    url: str, headers: dict[str, str] | None = None
+) -> tuple[int | None, str, dict[str, str]]:
     try:
-        status, final_url, headers = _try_head(url)
+        status, final_url, response_headers = _try_head(url, headers)
         if status in {405, 501}:
-            return _try_get_range(url)
-        return status, final_url, headers
+            return _try_get_range(url, headers)
+        return status, final_url, response_headers
     except urllib.error.HTTPError as exc:
+        # urllib surfaces 304 Not Modified as an HTTPError; it is still a success.
         if exc.code in {405, 501}:
-            return _try_get_range(url)
+            return _try_get_range(url, headers)
         return exc.code, exc.geturl(), {k.lower(): v for k, v in exc.headers.items()}
     except Exception:
         return None, url, {}
 
 
+def _load_previous_results(out_path: Path) -> dict[str, dict[str, Any]]:
+    try:
+        previous = json.loads(out_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    indexed: dict[str, dict[str, Any]] = {}
+    entries = (previous.get("results") or []) if isinstance(previous, dict) else []
+    for entry in entries:
+        if isinstance(entry, dict) and isinstance(entry.get("dependency_id"), str):
+            indexed[entry["dependency_id"]] = entry
+    return indexed
+
+
+def _conditional_headers(previous: dict[str, Any] | None, url: str) -> dict[str, str]:
+    """Replay validators from the last successful check of the same URL."""
+
+    if not previous or previous.get("url") != url or not previous.get("ok"):
+        return {}
+    headers: dict[str, str] = {}
+    if previous.get("etag"):
+        headers["If-None-Match"] = str(previous["etag"])
+    if previous.get("last_modified"):
+        headers["If-Modified-Since"] = str(previous["last_modified"])
+    return headers
+
+
+def _check_source(
+    url: str, conditional: dict[str, str]
+) -> tuple[int | None, str, dict[str, str], str]:
+    status, final_url, headers = _check_url(url, conditional)
+    return status, final_url, headers, _now_utc_iso()
+
+
 def _normalize_sources(data: dict[str, Any], *, only: str | None) -> list[dict[str, Any]]:
     sources = data.get("sources") or []
     normalized: list[dict[str, Any]] = []
@@ -143,7 +243,16 @@ def main(argv: list[str] | None = None) -> int:
         default=None,
         help="Only check dependency_id entries containing this substring",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f"Concurrent link checks (default: {DEFAULT_WORKERS})",
+    )
     args = parser.parse_args(argv)
+    if args.workers < 1:
+        print("ERROR: --workers must be >= 1", file=sys.stderr)
+        return 2
 
     try:
         sources_rel = Path(args.sources_json)
@@ -162,10 +271,38 @@ def main(argv: list[str] | None = None) -> int:
     data = json.loads(sources_path.read_text(encoding="utf-8"))
     sources = _normalize_sources(data, only=args.only)
 
+    out_path = resolve_under_repo(out_rel)
+    previous_results = _load_previous_results(out_path)
+    # Several dependencies can point at the same URL; check each URL once. A
+    # conditional request is only safe when every source sharing the URL would
+    # replay the same validators, since a 304 falls back on each one's history.
+    conditionals: dict[str, dict[str, str]] = {}
+    for src in sources:
+        conditional = _conditional_headers(previous_results.get(src["id"]), src["url"])
+        if src["url"] not in conditionals:
+            conditionals[src["url"]] = conditional
+        elif conditionals[src["url"]] != conditional:
+            conditionals[src["url"]] = {}
+    urls = list(conditionals)
+
+    # Link checks are network-bound; overlap them. map() keeps URL order.
+    with ThreadPoolExecutor(max_workers=max(1, min(args.workers, len(urls)))) as executor:
+        checks = dict(zip(urls, executor.map(_check_source, urls, conditionals.values())))
+
     results: list[dict[str, Any]] = []
     broken = 0
     for src in sources:
-        status, final_url, headers = _check_url(src["url"])
+        status, final_url, headers, checked_at_utc = checks[src["url"]]
+        previous = previous_results.get(src["id"]) or {}
+        if status == 304:
+            # Not Modified: no body was sent, so keep what the last check observed.
+            headers = {
+                "content-type": previous.get("observed_content_type", ""),
+                "etag": previous.get("etag", ""),
+                "last-modified": previous.get("last_modified", ""),
+                **headers,
+            }
+            final_url = previous.get("final_url") or final_url
         observed_content_type = headers.get("content-type", "")
         expected = src.get("expected_content_type", "")
         content_type_match = bool(expected and observed_content_type.startswith(expected))
@@ -182,9 +319,11 @@ def main(argv: list[str] | None = None) -> int:
             "content_type_match": content_type_match,
             "expected_content_type": expected,
             "server_audit_path": src.get("server_audit_path", ""),
+            "etag": headers.get("etag", ""),
+            "last_modified": headers.get("last-modified", ""),
         }
         if not args.no_timestamps:
-            entry["checked_at_utc"] = _now_utc_iso()
+            entry["checked_at_utc"] = checked_at_utc
         results.append(entry)
 
     report = {
@@ -193,9 +332,8 @@ def main(argv: list[str] | None = None) -> int:
         "results": results,
     }
 
-    out_path = resolve_under_repo(out_rel)
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    out_path.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    out_path.write_bytes(dumps_json_indented(report))
 
     for entry in results:
         status = entry.get("http_status")
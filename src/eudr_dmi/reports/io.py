@@ -2,18 +2,38 @@ from __future__ import annotations
 
 import hashlib
 import json
+import mmap
 import re
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+try:  # Optional speed-up
+    import orjson  # type: ignore[import-not-found]
+
+    _HAS_ORJSON = True
+    # Passthrough makes orjson raise TypeError on types json cannot encode.
+    _ORJSON_STABLE_OPTIONS = (
+        orjson.OPT_SORT_KEYS
+        | orjson.OPT_APPEND_NEWLINE
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+    )
+except Exception:
+    _HAS_ORJSON = False
+
+_PARALLEL_HASH_MIN_FILES = 4
+_SLUG_RE = re.compile(r"[^A-Za-z0-9._-]+")
+
 
 def utc_now_iso() -> str:
     return datetime.now(timezone.utc).replace(microsecond=0).isoformat()
 
 
 def safe_slug(value: str) -> str:
-    slug = re.sub(r"[^A-Za-z0-9._-]+", "_", value.strip())
+    slug = _SLUG_RE.sub("_", value.strip())
     if not slug:
         raise ValueError("empty slug")
     return slug
@@ -29,13 +49,68 @@ def read_optional_json(path: str | Path | None) -> dict[str, Any] | None:
     return read_json_file(path)
 
 
+def _orjson_would_differ(obj: Any) -> bool:
+    """Return True if orjson would not reproduce json's output for `obj`.
+
+    Both emit the shortest round-trip float repr, but they disagree on exponent
+    notation (``1e-05`` vs ``0.00001``) and on NaN/Infinity, and orjson
+    serializes UUIDs natively where json raises TypeError (datetimes and
+    dataclasses are handled by orjson's passthrough options). Checking keeps
+    the output byte-identical whether or not orjson is installed.
+    """
+
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+        elif isinstance(item, float):
+            magnitude = abs(item)
+            if magnitude != 0.0 and not 1e-4 <= magnitude < 1e16:
+                return True
+        elif isinstance(item, uuid.UUID):
+            return True
+    return False
+
+
+def _dumps_stable(payload: dict[str, Any]) -> bytes:
+    if _HAS_ORJSON and not _orjson_would_differ(payload):
+        try:
+            return orjson.dumps(payload, option=_ORJSON_STABLE_OPTIONS)
+        except TypeError:
+            # Non-string keys, integers beyond 64 bits or passthrough types
+            # (datetime, dataclass): let json handle (or reject) them.
+            pass
+    text = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return (text + "\n").encode("utf-8")
+
+
+def dumps_json_indented(payload: Any, *, ensure_ascii: bool = True) -> bytes:
+    """Return ``json.dumps(payload, indent=2, sort_keys=True) + "\\n"`` as UTF-8.
+
+    Uses orjson when it would produce the same bytes: no unportable floats, only
+    string keys, and (with ``ensure_ascii``) ASCII-only output, since orjson
+    never escapes non-ASCII text.
+    """
+
+    if _HAS_ORJSON and not _orjson_would_differ(payload):
+        try:
+            data = orjson.dumps(payload, option=_ORJSON_STABLE_OPTIONS | orjson.OPT_INDENT_2)
+        except TypeError:
+            pass
+        else:
+            if not ensure_ascii or data.isascii():
+                return data
+    text = json.dumps(payload, indent=2, sort_keys=True, ensure_ascii=ensure_ascii)
+    return (text + "\n").encode("utf-8")
+
+
 def write_json_stable(path: str | Path, payload: dict[str, Any]) -> None:
     p = Path(path)
     p.parent.mkdir(parents=True, exist_ok=True)
-    p.write_text(
-        json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False) + "\n",
-        encoding="utf-8",
-    )
+    p.write_bytes(_dumps_stable(payload))
 
 
 def write_text(path: str | Path, content: str) -> None:
@@ -45,19 +120,30 @@ def write_text(path: str | Path, content: str) -> None:
 
 
 def sha256_file(path: str | Path, *, chunk_size: int = 1024 * 1024) -> str:
-    h = hashlib.sha256()
     with Path(path).open("rb") as f:
-        for chunk in iter(lambda: f.read(chunk_size), b""):
-            h.update(chunk)
-    return h.hexdigest()
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return hashlib.sha256(mm).hexdigest()
+        except (OSError, ValueError):
+            # Empty files and non-regular files cannot be mapped; read them in
+            # chunk_size pieces instead.
+            h = hashlib.sha256()
+            for chunk in iter(lambda: f.read(chunk_size), b""):
+                h.update(chunk)
+            return h.hexdigest()
 
 
 def write_manifest_sha256(out_dir: str | Path, filenames: list[str]) -> Path:
     out_path = Path(out_dir)
-    lines: list[str] = []
-    for name in filenames:
-        file_path = out_path / name
-        lines.append(f"{sha256_file(file_path)}  {name}")
+    paths = [out_path / name for name in filenames]
+    if len(paths) < _PARALLEL_HASH_MIN_FILES:
+        digests = [sha256_file(p) for p in paths]
+    else:
+        # hashlib releases the GIL while hashing large buffers (the mmap view);
+        # map() keeps input order.
+        with ThreadPoolExecutor(max_workers=min(8, len(paths))) as ex:
+            digests = list(ex.map(sha256_file, paths))
+    lines = [f"{digest}  {name}" for digest, name in zip(digests, filenames)]
 
     manifest_path = out_path / "manifest.sha256"
     write_text(manifest_path, "\n".join(lines) + "\n")
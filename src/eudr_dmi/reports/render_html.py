@@ -1,22 +1,38 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Any
 
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from jinja2 import Environment, FileSystemLoader, Template, select_autoescape
 
 from .io import write_text
 from .schema import ReportV1
 
+_TEMPLATE: Template | None = None
 
-def render_report_html(report: ReportV1, output_path: str | Path) -> None:
-    template_dir = Path(__file__).resolve().parent / "templates"
-    env = Environment(
-        loader=FileSystemLoader(str(template_dir)),
-        autoescape=select_autoescape(["html", "xml"]),
-        trim_blocks=True,
-        lstrip_blocks=True,
-    )
-    template = env.get_template("report_v1.html.j2")
 
-    html = template.render(report=report.to_dict())
+def _get_template() -> Template:
+    global _TEMPLATE
+    if _TEMPLATE is None:
+        template_dir = Path(__file__).resolve().parent / "templates"
+        env = Environment(
+            loader=FileSystemLoader(str(template_dir)),
+            autoescape=select_autoescape(["html", "xml"]),
+            trim_blocks=True,
+            lstrip_blocks=True,
+            auto_reload=False,
+        )
+        _TEMPLATE = env.get_template("report_v1.html.j2")
+    return _TEMPLATE
+
+
+def render_report_html(
+    report: ReportV1,
+    output_path: str | Path,
+    *,
+    payload: dict[str, Any] | None = None,
+) -> None:
+    if payload is None:
+        payload = report.to_dict()
+    html = _get_template().render(report=payload)
     write_text(output_path, html)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Any
 
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.utils import ImageReader
@@ -15,7 +16,13 @@ def _as_text(value: object) -> str:
     return str(value)
 
 
-def render_report_pdf(report: ReportV1, output_path: str | Path) -> None:
+def render_report_pdf(
+    report: ReportV1,
+    output_path: str | Path,
+    *,
+    payload: dict[str, Any] | None = None,
+    include_images: bool = True,
+) -> None:
     out = Path(output_path)
     out.parent.mkdir(parents=True, exist_ok=True)
 
@@ -24,21 +31,49 @@ def render_report_pdf(report: ReportV1, output_path: str | Path) -> None:
     margin = 40
     y = height - margin
 
-    def write_line(text: str, *, size: int = 10, step: int = 14, bold: bool = False) -> None:
+    # Lines are accumulated in one text object per page (or per run between
+    # images) so the content stream only carries a font switch when the font
+    # actually changes, instead of a BT/Tf/Td/Tj/ET block per line.
+    text = c.beginText(margin, y)
+    text_y = y
+    text_font: tuple[str, int] | None = None
+    text_pending = False
+
+    def flush_text() -> None:
+        nonlocal text, text_y, text_font, text_pending
+        if text_pending:
+            c.drawText(text)
+        text = c.beginText(margin, y)
+        text_y = y
+        text_font = None
+        text_pending = False
+
+    def new_page() -> None:
         nonlocal y
+        flush_text()
+        c.showPage()
+        y = height - margin
+        flush_text()
+
+    def write_line(text_line: str, *, size: int = 10, step: int = 14, bold: bool = False) -> None:
+        nonlocal y, text_y, text_font, text_pending
         if y < margin:
-            c.showPage()
-            y = height - margin
-        font = "Helvetica-Bold" if bold else "Helvetica"
-        c.setFont(font, size)
-        c.drawString(margin, y, text)
+            new_page()
+        font = ("Helvetica-Bold" if bold else "Helvetica", size)
+        if font != text_font:
+            text.setFont(*font)
+            text_font = font
+        if y != text_y:
+            text.moveCursor(0, text_y - y)
+            text_y = y
+        if text_line:
+            text.textOut(text_line)
+            text_pending = True
         y -= step
 
     def ensure_space(required_height: float) -> None:
-        nonlocal y
         if y - required_height < margin:
-            c.showPage()
-            y = height - margin
+            new_page()
 
     def resolve_evidence_image(item: str) -> Path | None:
         item_path = out.parent / item
@@ -65,12 +100,14 @@ def render_report_pdf(report: ReportV1, output_path: str | Path) -> None:
         scale = min(max_width / float(img_w), max_height / float(img_h))
         draw_w = float(img_w) * scale
         draw_h = float(img_h) * scale
+        flush_text()
         ensure_space(draw_h + 10)
         y_top = y
         c.drawImage(str(image_path), margin, y_top - draw_h, width=draw_w, height=draw_h, preserveAspectRatio=True)
         y = y_top - draw_h - 10
 
-    payload = report.to_dict()
+    if payload is None:
+        payload = report.to_dict()
 
     write_line("EUDR Report V1", size=16, step=20, bold=True)
     write_line(f"Report ID: {payload['report_id']}")
@@ -112,6 +149,8 @@ def render_report_pdf(report: ReportV1, output_path: str | Path) -> None:
     if assess["evidence_maps"]:
         for item in assess["evidence_maps"]:
             write_line(f"Evidence map: {_as_text(item)}")
+            if not include_images:
+                continue
             image_path = resolve_evidence_image(str(item))
             if image_path is not None:
                 draw_evidence_image(image_path)
@@ -130,4 +169,5 @@ def render_report_pdf(report: ReportV1, output_path: str | Path) -> None:
         write_line(f"- {artifact}")
     write_line(f"Manifest pointer: {payload['manifest_path']}")
 
+    flush_text()
     c.save()
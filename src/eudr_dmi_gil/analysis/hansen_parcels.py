@@ -1,16 +1,19 @@
 from __future__ import annotations
 
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
+import os
 import re
+import threading
 from typing import Any, Iterable, Mapping
 
 import numpy as np
 import rasterio
 from rasterio.crs import CRS
 from rasterio.warp import calculate_default_transform, reproject, transform_geom
-from rasterio.enums import Resampling
+from rasterio.enums import MaskFlags, Resampling
 from rasterio.transform import array_bounds
 from rasterio.windows import Window, from_bounds, transform as window_transform
 from shapely.geometry import shape
@@ -25,6 +28,8 @@ except Exception:
 from eudr_dmi_gil.geo.forest_area_core import (
     forest_mask_end_year,
     pixel_area_m2_raster,
+    pixel_area_m2_rows,
+    rasterize_zone_labels,
     rasterize_zone_mask,
 )
 from eudr_dmi_gil.deps.hansen_tiles import hansen_tile_ids_for_bbox
@@ -97,12 +102,37 @@ if _NUMBA_AVAILABLE:
         return total
 
 
+# Numba's default workqueue threading layer does not support concurrent
+# parallel regions, and tiles are processed on a thread pool.
+_NUMBA_LOCK = threading.Lock()
+
+
 def _sum_area_m2(mask: np.ndarray, pixel_area_m2: np.ndarray) -> float:
     if _NUMBA_AVAILABLE:
-        return float(_sum_area_m2_numba(mask, pixel_area_m2))
+        with _NUMBA_LOCK:
+            return float(_sum_area_m2_numba(mask, pixel_area_m2))
     return float(np.sum(pixel_area_m2[mask], dtype=np.float64))
 
 
+def _read_band_valid(dataset: Any, window: Window) -> tuple[np.ndarray, np.ndarray]:
+    """Read band 1 as a plain array plus its validity mask.
+
+    Avoids building a MaskedArray: the nodata comparison is done once, and the
+    GDAL mask band is only read when the dataset has no nodata value but does
+    carry a per-dataset or alpha mask.
+    """
+
+    values = dataset.read(1, window=window)
+    nodata = dataset.nodata
+    if nodata is not None:
+        if np.isnan(nodata):
+            return values, ~np.isnan(values)
+        return values, values != nodata
+    if MaskFlags.all_valid in dataset.mask_flag_enums[0]:
+        return values, np.ones(values.shape, dtype=bool)
+    return values, dataset.read_masks(1, window=window) > 0
+
+
 def _crs_cache_key(crs: CRS | None) -> str:
     if crs is None:
         return "none"
@@ -299,15 +329,23 @@ def compute_hansen_parcel_stats(
         str,
         list[tuple[object, dict[str, Any], tuple[float, float, float, float]]],
     ] = {}
+    parcel_geometry_lock = threading.Lock()
 
     def _parcel_entries_for_crs(
         target_crs: CRS | None,
     ) -> list[tuple[object, dict[str, Any], tuple[float, float, float, float]]]:
         cache_key = _crs_cache_key(target_crs)
-        cached = parcel_geometry_cache.get(cache_key)
-        if cached is not None:
-            return cached
-
+        with parcel_geometry_lock:
+            cached = parcel_geometry_cache.get(cache_key)
+            if cached is not None:
+                return cached
+            entries = _build_parcel_entries(target_crs)
+            parcel_geometry_cache[cache_key] = entries
+            return entries
+
+    def _build_parcel_entries(
+        target_crs: CRS | None,
+    ) -> list[tuple[object, dict[str, Any], tuple[float, float, float, float]]]:
         entries: list[tuple[object, dict[str, Any], tuple[float, float, float, float]]] = []
         for parcel in parcel_list:
             source_geom = getattr(parcel, "geometry", None)
@@ -318,7 +356,6 @@ def compute_hansen_parcel_stats(
             else:
                 transformed_geom = transform_geom(parcel_crs, target_crs, source_geom)
             entries.append((parcel, transformed_geom, shape(transformed_geom).bounds))
-        parcel_geometry_cache[cache_key] = entries
         return entries
 
     tile_source = LocalTileSource(tile_dir)
@@ -335,8 +372,11 @@ def compute_hansen_parcel_stats(
     lossyear_tiles = _filter_tiles_by_bbox(lossyear_tiles, bbox_wgs84=bbox_wgs84)
     pairs = _pair_tiles(treecover_tiles, lossyear_tiles)
 
-    for tree_path, loss_path in pairs:
-        with rasterio.open(tree_path) as tree_ds, rasterio.open(loss_path) as loss_ds:
+    def _tile_areas(
+        tree_path: Path,
+        loss_path: Path,
+    ) -> list[tuple[object, float, float, float]]:
+        with rasterio.open(tree_path) as tree_ds:
             tree_bounds = (
                 float(tree_ds.bounds.left),
                 float(tree_ds.bounds.bottom),
@@ -349,7 +389,7 @@ def compute_hansen_parcel_stats(
                 if _bounds_intersect(entry[2], tree_bounds)
             ]
             if not parcel_entries:
-                continue
+                return []
 
             parcel_minx = min(entry[2][0] for entry in parcel_entries)
             parcel_miny = min(entry[2][1] for entry in parcel_entries)
@@ -363,23 +403,26 @@ def compute_hansen_parcel_stats(
                 min(tree_bounds[3], parcel_maxy),
             )
             if crop_bounds[0] >= crop_bounds[2] or crop_bounds[1] >= crop_bounds[3]:
-                continue
+                return []
 
             read_window = from_bounds(*crop_bounds, transform=tree_ds.transform)
             full_window = Window(col_off=0, row_off=0, width=tree_ds.width, height=tree_ds.height)
             read_window = read_window.intersection(full_window).round_offsets().round_lengths()
             if read_window.width <= 0 or read_window.height <= 0:
-                continue
+                return []
 
-            tree_band = tree_ds.read(1, window=read_window, masked=True)
-            loss_band = loss_ds.read(1, window=read_window, masked=True)
+            # The lossyear tile shares the treecover grid; only open it once the
+            # treecover bounds show that some parcel needs pixels from it.
+            tree_values, valid = _read_band_valid(tree_ds, read_window)
+            with rasterio.open(loss_path) as loss_ds:
+                loss_values, loss_valid = _read_band_valid(loss_ds, read_window)
 
-            if tree_band.shape != loss_band.shape:
+            if tree_values.shape != loss_values.shape:
                 raise RuntimeError("Mismatched raster shapes for treecover2000 and lossyear")
 
-            valid = (~tree_band.mask) & (~loss_band.mask)
-            tree_values = np.ma.filled(tree_band, 0)
-            loss_values = np.ma.filled(loss_band, 0)
+            # Invalid pixels keep their raw nodata values; every mask below is
+            # combined with `valid`, so they never contribute area.
+            valid &= loss_valid
 
             active_crs = tree_ds.crs
             active_transform = window_transform(read_window, tree_ds.transform)
@@ -405,7 +448,7 @@ def compute_hansen_parcel_stats(
                 if _bounds_intersect(entry[2], active_bounds)
             ]
             if not parcel_entries:
-                continue
+                return []
 
             forest_end_mask = forest_mask_end_year(
                 tree_values,
@@ -420,39 +463,98 @@ def compute_hansen_parcel_stats(
                 & valid
             )
 
-            pixel_area_m2 = pixel_area_m2_raster(
-                active_transform,
-                height=tree_values.shape[0],
-                width=tree_values.shape[1],
-                crs=active_crs,
-            )
-
-            for parcel, parcel_geom, _ in parcel_entries:
-                zone_mask = rasterize_zone_mask(
-                    parcel_geom,
-                    out_shape=tree_values.shape,
-                    transform=active_transform,
-                    all_touched=all_touched,
-                )
-
-                zone_valid = zone_mask & valid
-                if not np.any(zone_valid):
-                    continue
-
-                land_area_ha = _sum_area_m2(zone_valid, pixel_area_m2) / 10_000.0
-                forest_area_ha = (
-                    _sum_area_m2(forest_end_mask & zone_mask, pixel_area_m2) / 10_000.0
-                )
-                forest_loss_ha = (
-                    _sum_area_m2(forest_loss_mask & zone_mask, pixel_area_m2) / 10_000.0
+            height = tree_values.shape[0]
+            row_area_m2: np.ndarray | None = None
+            if active_transform.b == 0 and active_transform.d == 0:
+                # North-up grid: pixel area varies only by row, so keep one
+                # value per row and broadcast instead of materializing H x W.
+                row_area_m2 = pixel_area_m2_rows(active_transform, height=height, crs=active_crs)
+                pixel_area_m2 = np.broadcast_to(row_area_m2[:, None], tree_values.shape)
+            else:
+                pixel_area_m2 = pixel_area_m2_raster(
+                    active_transform,
+                    height=height,
+                    width=tree_values.shape[1],
+                    crs=active_crs,
                 )
 
-                current = stats[parcel.parcel_id]
-                stats[parcel.parcel_id] = HansenParcelStats(
-                    parcel_id=parcel.parcel_id,
-                    hansen_land_area_ha=current.hansen_land_area_ha + land_area_ha,
-                    hansen_forest_area_ha=current.hansen_forest_area_ha + forest_area_ha,
-                    hansen_forest_loss_ha=current.hansen_forest_loss_ha + forest_loss_ha,
-                )
+            labels = rasterize_zone_labels(
+                [parcel_geom for _, parcel_geom, _ in parcel_entries],
+                out_shape=tree_values.shape,
+                transform=active_transform,
+                all_touched=all_touched,
+            )
+            if labels is not None:
+                # Non-overlapping parcels: a single weighted bincount over the
+                # parcel pixels covers every parcel and measure at once. Each
+                # pixel is keyed by (label, forest bit, loss bit).
+                label_count = len(parcel_entries) + 1
+                zone_valid = (labels > 0) & valid
+                keys = labels[zone_valid].astype(np.int64) * 4
+                keys += forest_end_mask[zone_valid]
+                keys += forest_loss_mask[zone_valid].astype(np.int64) * 2
+                if row_area_m2 is None:
+                    weights = pixel_area_m2[zone_valid]
+                else:
+                    weights = row_area_m2[np.nonzero(zone_valid)[0]]
+                totals = np.bincount(keys, weights=weights, minlength=label_count * 4)
+                totals = totals.reshape(label_count, 4)
+                land_m2 = totals.sum(axis=1)
+                forest_m2 = totals[:, 1] + totals[:, 3]
+                loss_m2 = totals[:, 2] + totals[:, 3]
+                tile_areas = [
+                    (
+                        parcel,
+                        float(land_m2[index]) / 10_000.0,
+                        float(forest_m2[index]) / 10_000.0,
+                        float(loss_m2[index]) / 10_000.0,
+                    )
+                    for index, (parcel, _, _) in enumerate(parcel_entries, start=1)
+                    if land_m2[index] > 0.0
+                ]
+            else:
+                tile_areas = []
+                for parcel, parcel_geom, _ in parcel_entries:
+                    zone_mask = rasterize_zone_mask(
+                        parcel_geom,
+                        out_shape=tree_values.shape,
+                        transform=active_transform,
+                        all_touched=all_touched,
+                    )
+
+                    zone_valid = zone_mask & valid
+                    if not np.any(zone_valid):
+                        continue
+
+                    tile_areas.append(
+                        (
+                            parcel,
+                            _sum_area_m2(zone_valid, pixel_area_m2) / 10_000.0,
+                            _sum_area_m2(forest_end_mask & zone_mask, pixel_area_m2) / 10_000.0,
+                            _sum_area_m2(forest_loss_mask & zone_mask, pixel_area_m2) / 10_000.0,
+                        )
+                    )
+
+            return tile_areas
+
+    # Tiles are independent: rasterio reads and the NumPy reductions release
+    # the GIL, so threads overlap I/O with compute. Results are merged in tile
+    # order to keep the floating-point sums deterministic.
+    max_workers = min(len(pairs), os.cpu_count() or 1)
+    if max_workers > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            per_tile = list(executor.map(_tile_areas, *zip(*pairs)))
+    else:
+        per_tile = [_tile_areas(tree_path, loss_path) for tree_path, loss_path in pairs]
+
+    for tile_areas in per_tile:
+        for parcel, land_area_ha, forest_area_ha, forest_loss_ha in tile_areas:
+            current = stats[parcel.parcel_id]
+            stats[parcel.parcel_id] = HansenParcelStats(
+                parcel_id=parcel.parcel_id,
+                hansen_land_area_ha=current.hansen_land_area_ha + land_area_ha,
+                hansen_forest_area_ha=current.hansen_forest_area_ha + forest_area_ha,
+                hansen_forest_loss_ha=current.hansen_forest_loss_ha + forest_loss_ha,
+            )
 
     return stats
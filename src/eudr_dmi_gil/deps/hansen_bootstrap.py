@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Iterable
+from typing import Any, Iterable
 
 from eudr_dmi_gil.io import data_plane
 from eudr_dmi_gil.reports.determinism import sha256_file, write_json
@@ -23,11 +24,14 @@ DEFAULT_HANSEN_URL_TEMPLATE = (
     "https://storage.googleapis.com/earthenginepartners-hansen/"
     "GFC-2024-v1.12/Hansen_GFC-2024-v1.12_{layer}_{url_tile_id}.tif"
 )
+HANSEN_CONCURRENCY_ENV = "EUDR_DMI_HANSEN_CONCURRENCY"
+DEFAULT_HANSEN_CONCURRENCY = 16
 
 
 try:
-    from .hansen_tiles import hansen_tile_ids_for_bbox, load_aoi_bbox
+    from .hansen_tiles import aoi_bbox, hansen_tile_ids_for_bbox, load_aoi_bbox
 except Exception:  # pragma: no cover - fallback for import errors
+    aoi_bbox = None
     hansen_tile_ids_for_bbox = None
     load_aoi_bbox = None
 
@@ -40,10 +44,24 @@ def _ensure_default_url_template() -> str:
     return url_template
 
 
-def _resolve_tile_ids(aoi_geojson_path: Path) -> list[str]:
-    if load_aoi_bbox is None or hansen_tile_ids_for_bbox is None:
+def _hansen_concurrency() -> int:
+    raw = os.environ.get(HANSEN_CONCURRENCY_ENV, "").strip()
+    if not raw:
+        return DEFAULT_HANSEN_CONCURRENCY
+    try:
+        value = int(raw)
+    except ValueError as exc:
+        raise ValueError(f"{HANSEN_CONCURRENCY_ENV} must be an integer") from exc
+    return max(1, value)
+
+
+def _resolve_tile_ids(aoi_geojson_path: Path, aoi_geojson: Any | None = None) -> list[str]:
+    if aoi_bbox is None or load_aoi_bbox is None or hansen_tile_ids_for_bbox is None:
         raise RuntimeError("Hansen tile utilities are unavailable")
-    bbox = load_aoi_bbox(aoi_geojson_path)
+    if aoi_geojson is not None:
+        bbox = aoi_bbox(aoi_geojson)
+    else:
+        bbox = load_aoi_bbox(aoi_geojson_path)
     tile_ids = hansen_tile_ids_for_bbox(bbox)
     if not tile_ids:
         raise ValueError("No Hansen tiles intersect AOI bbox")
@@ -99,13 +117,21 @@ def ensure_hansen_for_aoi(
     download: bool,
     minio_cache_enabled: bool = False,
     offline: bool = False,
+    aoi_geojson: Any | None = None,
 ) -> Path:
+    """Ensure Hansen tiles covering the AOI are present and write their manifest.
+
+    ``aoi_geojson`` may carry the already-decoded contents of
+    ``aoi_geojson_path`` so callers that have read the file do not pay for a
+    second parse.
+    """
+
     if not aoi_id.strip():
         raise ValueError("aoi_id must be non-empty")
     if not aoi_geojson_path.is_file():
         raise FileNotFoundError(f"AOI GeoJSON not found: {aoi_geojson_path}")
 
-    tile_ids = _resolve_tile_ids(aoi_geojson_path)
+    tile_ids = _resolve_tile_ids(aoi_geojson_path, aoi_geojson)
     layers_list = sorted({layer.strip() for layer in layers if layer.strip()})
     if not layers_list:
         raise ValueError("At least one layer is required")
@@ -117,54 +143,55 @@ def ensure_hansen_for_aoi(
         endpoint, access_key, secret_key, bucket = _minio_env()
         minio_cache.ensure_bucket(endpoint, access_key, secret_key, bucket)
 
-    entries: list[HansenLayerEntry] = []
     effective_download = download and not offline
 
-    for tile_id in tile_ids:
-        missing_layers: list[str] = []
+    def _ensure_layer(item: tuple[str, str]) -> list[HansenLayerEntry]:
+        tile_id, layer = item
         if minio_cache_enabled:
-            for layer in layers_list:
-                local_path = resolve_tile_dir(tile_id) / f"{layer}.tif"
-                source_url = _format_url(url_template, tile_id=tile_id, layer=layer)
-                key = _cache_key(tile_id, layer)
-                # get_file_if_exists handles all three cases:
-                #   1. Local file present and SHA-256 matches stored metadata → skip download.
-                #   2. Local file present but SHA-256 mismatch → delete and re-download.
-                #   3. Local file absent → download from MinIO.
-                if minio_cache.get_file_if_exists(bucket, key, local_path):
-                    entries.append(
-                        _entry_from_local(
-                            tile_id,
-                            layer,
-                            local_path,
-                            status="cached",
-                            source_url=source_url,
-                        )
+            local_path = resolve_tile_dir(tile_id) / f"{layer}.tif"
+            source_url = _format_url(url_template, tile_id=tile_id, layer=layer)
+            # get_file_if_exists handles all three cases:
+            #   1. Local file present and SHA-256 matches stored metadata → skip download.
+            #   2. Local file present but SHA-256 mismatch → delete and re-download.
+            #   3. Local file absent → download from MinIO.
+            if minio_cache.get_file_if_exists(bucket, _cache_key(tile_id, layer), local_path):
+                return [
+                    _entry_from_local(
+                        tile_id,
+                        layer,
+                        local_path,
+                        status="cached",
+                        source_url=source_url,
                     )
-                    continue
-                missing_layers.append(layer)
-        else:
-            missing_layers = list(layers_list)
-
-        if missing_layers:
-            if not effective_download:
-                raise RuntimeError(
-                    f"Missing Hansen tiles for {tile_id} (offline/minio-only mode enabled)."
-                )
-            downloaded_entries = ensure_hansen_layers_present(
-                tile_id, missing_layers, download=effective_download
+                ]
+
+        if not effective_download:
+            raise RuntimeError(
+                f"Missing Hansen tiles for {tile_id} (offline/minio-only mode enabled)."
             )
-            entries.extend(downloaded_entries)
-            if minio_cache_enabled:
-                for entry in downloaded_entries:
-                    if entry.status in {"downloaded", "present"}:
-                        key = _cache_key(entry.tile_id, entry.layer)
-                        minio_cache.put_file(
-                            bucket,
-                            key,
-                            Path(entry.local_path),
-                            content_type="image/tiff",
-                        )
+        downloaded_entries = ensure_hansen_layers_present(
+            tile_id, [layer], download=effective_download
+        )
+        if minio_cache_enabled:
+            for entry in downloaded_entries:
+                if entry.status in {"downloaded", "present"}:
+                    minio_cache.put_file(
+                        bucket,
+                        _cache_key(entry.tile_id, entry.layer),
+                        Path(entry.local_path),
+                        content_type="image/tiff",
+                    )
+        return downloaded_entries
+
+    # Each (tile, layer) pair is an independent, I/O-bound fetch (MinIO stat/get,
+    # HTTPS download, MinIO put), so run them concurrently; ordering is restored
+    # by the sort below.
+    work_items = [(tile_id, layer) for tile_id in tile_ids for layer in layers_list]
+    entries: list[HansenLayerEntry] = []
+    max_workers = min(_hansen_concurrency(), len(work_items))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for item_entries in executor.map(_ensure_layer, work_items):
+            entries.extend(item_entries)
 
     ordered_entries = sorted(
         entries, key=lambda e: (e.tile_id, e.layer, e.local_path)
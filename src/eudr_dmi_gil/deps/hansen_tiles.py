@@ -3,7 +3,14 @@ from __future__ import annotations
 import json
 import math
 from pathlib import Path
-from typing import Iterable
+from typing import Any, Iterable
+
+try:  # Optional speed-up
+    import orjson  # type: ignore[import-not-found]
+
+    _HAS_ORJSON = True
+except Exception:
+    _HAS_ORJSON = False
 
 
 def _iter_coords(obj: object) -> Iterable[tuple[float, float]]:
@@ -28,9 +35,16 @@ def _iter_coords(obj: object) -> Iterable[tuple[float, float]]:
                     yield from _iter_coords(geom)
 
 
-def load_aoi_bbox(aoi_geojson_path: Path) -> tuple[float, float, float, float]:
-    data = json.loads(aoi_geojson_path.read_text(encoding="utf-8"))
-    coords = list(_iter_coords(data))
+def loads_geojson(data: bytes) -> Any:
+    """Decode GeoJSON bytes, using orjson when it is installed."""
+
+    if _HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def aoi_bbox(geojson: Any) -> tuple[float, float, float, float]:
+    coords = list(_iter_coords(geojson))
     if not coords:
         raise ValueError("AOI GeoJSON contains no coordinates")
     xs = [c[0] for c in coords]
@@ -38,6 +52,10 @@ def load_aoi_bbox(aoi_geojson_path: Path) -> tuple[float, float, float, float]:
     return min(xs), min(ys), max(xs), max(ys)
 
 
+def load_aoi_bbox(aoi_geojson_path: Path) -> tuple[float, float, float, float]:
+    return aoi_bbox(loads_geojson(aoi_geojson_path.read_bytes()))
+
+
 def _band_start(value: float, band_size: int = 10) -> int:
     return int(math.floor(value / band_size) * band_size)
 
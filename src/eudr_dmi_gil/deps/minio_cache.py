@@ -1,22 +1,23 @@
 from __future__ import annotations
 
-import hashlib
+import functools
 import mimetypes
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from minio import Minio
 from minio.error import S3Error
 
-_METADATA_SHA256_KEY = "x-amz-meta-sha256"
+from eudr_dmi_gil.reports.determinism import sha256_file
 
+_METADATA_SHA256_KEY = "x-amz-meta-sha256"
 
-def _sha256_file(path: Path) -> str:
-    h = hashlib.sha256()
-    with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(1024 * 1024), b""):
-            h.update(chunk)
-    return h.hexdigest()
+# Hansen layers are 100-500 MB: upload in 64 MiB multipart parts and download
+# in 16 MiB byte ranges, both spread over MINIO_PART_CONCURRENCY threads.
+_PART_SIZE = 64 * 1024 * 1024
+_RANGE_SIZE = 16 * 1024 * 1024
+_DEFAULT_PART_CONCURRENCY = 8
 
 
 def _parse_endpoint(raw: str) -> tuple[str, bool | None]:
@@ -47,6 +48,21 @@ def _resolve_secure(scheme_secure: bool | None) -> bool:
     return True  # default to TLS
 
 
+@functools.lru_cache(maxsize=8)
+def _cached_client(endpoint: str, access_key: str, secret_key: str, secure: bool) -> Minio:
+    """Return a shared client per connection config.
+
+    Reusing the client keeps its urllib3 pool (and TLS sessions) warm across
+    calls; ``minio.Minio`` is safe for concurrent use from multiple threads.
+    """
+    return Minio(endpoint, access_key=access_key, secret_key=secret_key, secure=secure)
+
+
+def _client_for(raw_endpoint: str, access_key: str, secret_key: str) -> Minio:
+    endpoint, scheme_secure = _parse_endpoint(raw_endpoint)
+    return _cached_client(endpoint, access_key, secret_key, _resolve_secure(scheme_secure))
+
+
 def _client_from_env() -> Minio:
     raw_endpoint = os.environ.get("MINIO_ENDPOINT", "").strip()
     access_key = os.environ.get("MINIO_ACCESS_KEY", "").strip()
@@ -55,15 +71,71 @@ def _client_from_env() -> Minio:
     if not raw_endpoint or not access_key or not secret_key:
         raise RuntimeError("Missing MINIO_ENDPOINT/MINIO_ACCESS_KEY/MINIO_SECRET_KEY")
 
-    endpoint, scheme_secure = _parse_endpoint(raw_endpoint)
-    secure = _resolve_secure(scheme_secure)
-    return Minio(endpoint, access_key=access_key, secret_key=secret_key, secure=secure)
+    return _client_for(raw_endpoint, access_key, secret_key)
+
+
+def _part_concurrency() -> int:
+    raw = os.environ.get("MINIO_PART_CONCURRENCY", "").strip()
+    if not raw:
+        return _DEFAULT_PART_CONCURRENCY
+    try:
+        value = int(raw)
+    except ValueError as exc:
+        raise ValueError("MINIO_PART_CONCURRENCY must be an integer") from exc
+    return max(1, value)
+
+
+def _fget_ranged(client: Minio, bucket: str, key: str, dest_path: Path, size: int) -> None:
+    """Download an object with concurrent ranged GETs written in place.
+
+    Falls back to a single-stream ``fget_object`` for small objects, when only
+    one worker is configured, or where ``os.pwrite`` is unavailable.
+    """
+
+    workers = _part_concurrency()
+    if size <= _RANGE_SIZE or workers == 1 or not hasattr(os, "pwrite"):
+        client.fget_object(bucket, key, str(dest_path))
+        return
+
+    offsets = range(0, size, _RANGE_SIZE)
+    tmp_path = dest_path.with_name(dest_path.name + ".part")
+    try:
+        with tmp_path.open("wb") as fh:
+            fh.truncate(size)
+            fd = fh.fileno()
+
+            def _fetch(offset: int) -> None:
+                length = min(_RANGE_SIZE, size - offset)
+                response = client.get_object(bucket, key, offset=offset, length=length)
+                position = offset
+                try:
+                    for chunk in response.stream(1024 * 1024):
+                        view = memoryview(chunk)
+                        while view:
+                            written = os.pwrite(fd, view, position)
+                            position += written
+                            view = view[written:]
+                finally:
+                    response.close()
+                    response.release_conn()
+                if position != offset + length:
+                    raise RuntimeError(
+                        f"Short read for {key} at offset {offset}: "
+                        f"expected {length} bytes, got {position - offset}"
+                    )
+
+            with ThreadPoolExecutor(max_workers=min(workers, len(offsets))) as executor:
+                # Consume the iterator so the first failure is raised here.
+                for _ in executor.map(_fetch, offsets):
+                    pass
+        tmp_path.replace(dest_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
 
 def ensure_bucket(endpoint: str, access_key: str, secret_key: str, bucket: str) -> None:
-    host, scheme_secure = _parse_endpoint(endpoint)
-    secure = _resolve_secure(scheme_secure)
-    client = Minio(host, access_key=access_key, secret_key=secret_key, secure=secure)
+    client = _client_for(endpoint, access_key, secret_key)
     if not client.bucket_exists(bucket):
         client.make_bucket(bucket)
 
@@ -72,13 +144,15 @@ def put_file(bucket: str, key: str, local_path: Path, content_type: str | None =
     client = _client_from_env()
     if content_type is None:
         content_type, _ = mimetypes.guess_type(str(local_path))
-    sha256 = _sha256_file(local_path)
+    sha256 = sha256_file(local_path)
     client.fput_object(
         bucket,
         key,
         str(local_path),
         content_type=content_type,
         metadata={"sha256": sha256},
+        part_size=_PART_SIZE,
+        num_parallel_uploads=_part_concurrency(),
     )
 
 
@@ -95,18 +169,18 @@ def get_file_if_exists(bucket: str, key: str, dest_path: Path) -> bool:
 
     # If a local file already exists, check SHA-256 before downloading.
     if dest_path.is_file():
-        if stored_sha256 and _sha256_file(dest_path) == stored_sha256:
+        if stored_sha256 and sha256_file(dest_path) == stored_sha256:
             # Local file is intact — skip download.
             return True
         # Local file is stale or corrupted — remove before re-downloading.
         dest_path.unlink()
 
     dest_path.parent.mkdir(parents=True, exist_ok=True)
-    client.fget_object(bucket, key, str(dest_path))
+    _fget_ranged(client, bucket, key, dest_path, stat.size or 0)
 
     # Verify integrity of the downloaded file.
     if stored_sha256:
-        downloaded_sha256 = _sha256_file(dest_path)
+        downloaded_sha256 = sha256_file(dest_path)
         if downloaded_sha256 != stored_sha256:
             dest_path.unlink(missing_ok=True)
             raise RuntimeError(
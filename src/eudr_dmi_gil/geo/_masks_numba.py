@@ -0,0 +1,73 @@
+"""Fused Numba kernels for the Hansen mask helpers in `forest_area_core`.
+
+Each kernel streams treecover2000/lossyear once and writes the boolean mask
+directly, instead of materializing one temporary boolean raster per
+comparison. Kernels are serial and release the GIL so callers can run tiles on
+a thread pool; they compile lazily on first use and are cached on disk.
+
+Importing this module raises ImportError when numba is not installed.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True, nogil=True)
+def forest_mask_end_year_nb(
+    treecover2000: np.ndarray,
+    lossyear: np.ndarray,
+    canopy_threshold: int,
+    end_code: int,
+    out: np.ndarray,
+) -> None:
+    rows, cols = treecover2000.shape
+    for i in range(rows):
+        for j in range(cols):
+            loss = lossyear[i, j]
+            out[i, j] = treecover2000[i, j] >= canopy_threshold and (loss == 0 or loss > end_code)
+
+
+@njit(cache=True, nogil=True)
+def loss_mask_range_nb(
+    treecover2000: np.ndarray,
+    lossyear: np.ndarray,
+    canopy_threshold: int,
+    start_code: int,
+    end_code: int,
+    out: np.ndarray,
+) -> None:
+    rows, cols = treecover2000.shape
+    for i in range(rows):
+        for j in range(cols):
+            loss = lossyear[i, j]
+            out[i, j] = (
+                treecover2000[i, j] >= canopy_threshold and loss >= start_code and loss <= end_code
+            )
+
+
+@njit(cache=True, nogil=True)
+def loss_total_mask_nb(
+    treecover2000: np.ndarray,
+    lossyear: np.ndarray,
+    canopy_threshold: int,
+    out: np.ndarray,
+) -> None:
+    rows, cols = treecover2000.shape
+    for i in range(rows):
+        for j in range(cols):
+            out[i, j] = treecover2000[i, j] >= canopy_threshold and lossyear[i, j] > 0
+
+
+@njit(cache=True, nogil=True)
+def forest_2024_mask_nb(
+    treecover2000: np.ndarray,
+    lossyear: np.ndarray,
+    canopy_threshold: int,
+    out: np.ndarray,
+) -> None:
+    rows, cols = treecover2000.shape
+    for i in range(rows):
+        for j in range(cols):
+            out[i, j] = treecover2000[i, j] >= canopy_threshold and lossyear[i, j] == 0
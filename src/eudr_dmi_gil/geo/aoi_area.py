@@ -1,15 +1,18 @@
 from __future__ import annotations
 
-import json
 from pathlib import Path
 
-from pyproj import Geod
-from shapely.geometry import shape
-from shapely.ops import unary_union
+from eudr_dmi_gil.deps.hansen_tiles import loads_geojson
+
+# pyproj and shapely are imported on first use so that importing this module
+# (e.g. via the reports CLI) stays cheap.
 
 
 def _load_union_geometry(aoi_geojson_path: Path):
-    data = json.loads(aoi_geojson_path.read_text(encoding="utf-8"))
+    from shapely.geometry import shape
+    from shapely.ops import unary_union
+
+    data = loads_geojson(aoi_geojson_path.read_bytes())
 
     if data.get("type") == "FeatureCollection":
         geoms = [shape(feat["geometry"]) for feat in data.get("features", []) if feat.get("geometry")]
@@ -33,6 +36,8 @@ def compute_aoi_geodesic_area_ha(aoi_geojson_path: Path) -> tuple[float, str]:
       (area_ha, method_string)
     """
 
+    from pyproj import Geod
+
     geom = _load_union_geometry(aoi_geojson_path)
     geod = Geod(ellps="WGS84")
 
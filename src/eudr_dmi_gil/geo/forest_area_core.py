@@ -1,12 +1,29 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any
 
 import numpy as np
-import rasterio
-from pyproj import Geod
-from rasterio.crs import CRS
-from rasterio.features import rasterize
+
+# rasterio, pyproj and numba are imported inside the functions that need them:
+# together they add ~250 ms to import time, which callers of the pure-NumPy
+# mask helpers should not pay.
+
+
+@lru_cache(maxsize=1)
+def _get_geod_wgs84() -> Any:
+    from pyproj import Geod
+
+    return Geod(ellps="WGS84")
+
+
+@lru_cache(maxsize=1)
+def _numba_kernels() -> Any:
+    try:  # Optional speed-up
+        from eudr_dmi_gil.geo import _masks_numba
+    except Exception:
+        return None
+    return _masks_numba
 
 
 def pixel_area_m2_raster(transform: Any, height: int, width: int, crs: Any) -> np.ndarray:
@@ -20,7 +37,8 @@ def pixel_area_m2_raster(transform: Any, height: int, width: int, crs: Any) -> n
 
     Notes:
       - If `crs` is EPSG:4326, compute geodesic WGS84 pixel area using
-        pyproj.Geod polygon areas for each pixel footprint.
+        pyproj.Geod polygon areas. North-up grids need one footprint per row;
+        rotated grids fall back to one footprint per pixel.
       - Otherwise, treat pixels as projected and use constant area from affine scale.
     """
 
@@ -30,11 +48,19 @@ def pixel_area_m2_raster(transform: Any, height: int, width: int, crs: Any) -> n
     if crs is None:
         raise ValueError("CRS is required to compute pixel areas")
 
+    from rasterio.crs import CRS
+
     crs_obj = CRS.from_user_input(crs)
     epsg = crs_obj.to_epsg()
 
+    if epsg == 4326 and transform.b == 0 and transform.d == 0:
+        # On a north-up lon/lat grid the geodesic pixel area depends only on
+        # the latitude band, so one Geod call per row covers the whole row.
+        row_area_m2 = pixel_area_m2_rows(transform, height=height, crs=crs_obj)
+        return np.repeat(row_area_m2[:, None], width, axis=1)
+
     if epsg == 4326:
-        geod = Geod(ellps="WGS84")
+        geod = _get_geod_wgs84()
         area_m2 = np.zeros((height, width), dtype=np.float64)
         for row in range(height):
             for col in range(width):
@@ -50,6 +76,76 @@ def pixel_area_m2_raster(transform: Any, height: int, width: int, crs: Any) -> n
     return np.full((height, width), pixel_area, dtype=np.float64)
 
 
+@lru_cache(maxsize=64)
+def _geodesic_row_areas_m2(a: float, c: float, e: float, f: float, height: int) -> np.ndarray:
+    # Memoized per grid: tiles and windows are revisited within a run (several
+    # AOIs, or treecover/lossyear passes over the same window). The cached
+    # array is shared, so it is returned read-only.
+    geod = _get_geod_wgs84()
+    x1 = c + a
+    area_m2 = np.empty(height, dtype=np.float64)
+    for row in range(height):
+        y0 = f + e * row
+        y1 = y0 + e
+        pixel_area, _ = geod.polygon_area_perimeter([c, x1, x1, c], [y0, y0, y1, y1])
+        area_m2[row] = abs(pixel_area)
+    area_m2.flags.writeable = False
+    return area_m2
+
+
+def pixel_area_m2_rows(transform: Any, height: int, crs: Any) -> np.ndarray:
+    """Return the pixel area in square meters for each row of a north-up raster.
+
+    Units:
+      - Output is square meters ($m^2$) per pixel, one value per row.
+
+    Notes:
+      - On a north-up grid every pixel in a row has the same footprint: for
+        EPSG:4326 the geodesic area depends only on the latitude band, and for
+        projected CRSs it is constant. Rotated transforms raise ValueError;
+        use `pixel_area_m2_raster` for those.
+      - EPSG:4326 results are memoized per grid and returned read-only.
+    """
+
+    if height <= 0:
+        return np.zeros(0, dtype=np.float64)
+
+    if crs is None:
+        raise ValueError("CRS is required to compute pixel areas")
+    if transform.b != 0 or transform.d != 0:
+        raise ValueError("pixel_area_m2_rows requires a north-up transform")
+
+    from rasterio.crs import CRS
+
+    crs_obj = CRS.from_user_input(crs)
+    epsg = crs_obj.to_epsg()
+
+    if epsg == 4326:
+        return _geodesic_row_areas_m2(
+            float(transform.a),
+            float(transform.c),
+            float(transform.e),
+            float(transform.f),
+            height,
+        )
+
+    pixel_area = abs(float(transform.a) * float(transform.e))
+    return np.full(height, pixel_area, dtype=np.float64)
+
+
+def _fused_kernels(treecover2000: np.ndarray, lossyear: np.ndarray) -> Any:
+    if not (
+        isinstance(treecover2000, np.ndarray)
+        and isinstance(lossyear, np.ndarray)
+        and treecover2000.dtype == np.uint8
+        and lossyear.dtype == np.uint8
+        and treecover2000.ndim == 2
+        and treecover2000.shape == lossyear.shape
+    ):
+        return None
+    return _numba_kernels()
+
+
 def forest_mask_end_year(
     treecover2000: np.ndarray,
     lossyear: np.ndarray,
@@ -65,9 +161,19 @@ def forest_mask_end_year(
       - `lossyear` code = calendar_year - 2000 (1..24 => 2001..2024).
 
     Determinism:
-      - Uses vectorized numpy operations with stable boolean logic.
+      - Uses vectorized numpy operations with stable boolean logic, or a fused
+        Numba kernel with the same logic for uint8 rasters when numba is
+        installed.
     """
 
+    kernels = _fused_kernels(treecover2000, lossyear)
+    if kernels is not None:
+        out = np.empty(treecover2000.shape, dtype=np.bool_)
+        kernels.forest_mask_end_year_nb(
+            treecover2000, lossyear, canopy_threshold, end_year - 2000, out
+        )
+        return out
+
     forest2000 = treecover2000 >= canopy_threshold
     loss_after_end_year = lossyear > (end_year - 2000)
     remaining_forest = forest2000 & ((lossyear == 0) | loss_after_end_year)
@@ -94,6 +200,12 @@ def loss_total_mask(
 ) -> np.ndarray:
     """Return total loss mask for any loss year > 0 within RFM."""
 
+    kernels = _fused_kernels(treecover2000, lossyear)
+    if kernels is not None:
+        out = np.empty(treecover2000.shape, dtype=np.bool_)
+        kernels.loss_total_mask_nb(treecover2000, lossyear, canopy_threshold, out)
+        return out
+
     return rfm_mask(treecover2000, canopy_threshold) & (lossyear > 0)
 
 
@@ -114,6 +226,12 @@ def forest_2024_mask(
 ) -> np.ndarray:
     """Return forest mask for 2024: RFM and lossyear == 0."""
 
+    kernels = _fused_kernels(treecover2000, lossyear)
+    if kernels is not None:
+        out = np.empty(treecover2000.shape, dtype=np.bool_)
+        kernels.forest_2024_mask_nb(treecover2000, lossyear, canopy_threshold, out)
+        return out
+
     return rfm_mask(treecover2000, canopy_threshold) & (lossyear == 0)
 
 
@@ -133,12 +251,20 @@ def loss_mask_range(
       - `lossyear` code = calendar_year - 2000 (1..24 => 2001..2024).
 
     Determinism:
-      - Uses vectorized numpy operations with stable boolean logic.
+      - Uses vectorized numpy operations with stable boolean logic, or a fused
+        Numba kernel with the same logic for uint8 rasters when numba is
+        installed.
     """
 
-    forest2000 = treecover2000 >= canopy_threshold
     sy = start_year - 2000
     ey = end_year - 2000
+    kernels = _fused_kernels(treecover2000, lossyear)
+    if kernels is not None:
+        out = np.empty(treecover2000.shape, dtype=np.bool_)
+        kernels.loss_mask_range_nb(treecover2000, lossyear, canopy_threshold, sy, ey, out)
+        return out
+
+    forest2000 = treecover2000 >= canopy_threshold
     return forest2000 & (lossyear >= sy) & (lossyear <= ey)
 
 
@@ -161,7 +287,11 @@ def zonal_area_ha(
         raise ValueError("mask_bool, pixel_area_m2, and zone_mask_bool must share shape")
 
     combined = mask_bool & zone_mask_bool
-    area_m2 = np.sum(pixel_area_m2[combined], dtype=np.float64)
+    # Masked dot product: streams both arrays once in buffered chunks instead
+    # of gathering the selected pixel areas into a temporary array. The sublist
+    # form labels every axis, so any ndim reduces to a scalar.
+    axes = list(range(combined.ndim))
+    area_m2 = np.einsum(pixel_area_m2, axes, combined, axes, [], dtype=np.float64)
     return float(area_m2) / 10_000.0
 
 
@@ -186,6 +316,8 @@ def rasterize_zone_mask(
     if hasattr(geom, "__geo_interface__"):
         geom = geom.__geo_interface__
 
+    from rasterio.features import rasterize
+
     burned = rasterize(
         [(geom, 1)],
         out_shape=out_shape,
@@ -194,4 +326,63 @@ def rasterize_zone_mask(
         dtype=np.uint8,
         all_touched=all_touched,
     )
-    return burned.astype(bool)
+    # Burned values are exactly 0/1, which is the bool_ byte layout: reinterpret
+    # instead of copying the whole raster.
+    return burned.view(np.bool_)
+
+
+def rasterize_zone_labels(
+    geoms: list[Any],
+    out_shape: tuple[int, int],
+    transform: Any,
+    all_touched: bool = True,
+) -> np.ndarray | None:
+    """Rasterize polygon geometries into a single label raster.
+
+    Units:
+      - Output is an int32 raster where pixel value `i + 1` marks `geoms[i]`
+        and 0 is background.
+
+    Determinism:
+      - Rasterization with fixed `all_touched` yields stable results.
+
+    Notes:
+      - A label raster can hold only one zone per pixel. If any two geometries
+        burn the same pixel, None is returned so callers can fall back to
+        per-zone masks from `rasterize_zone_mask`.
+    """
+
+    shapes = []
+    for geom in geoms:
+        if geom is None:
+            raise ValueError("Geometry is required for rasterization")
+        if hasattr(geom, "__geo_interface__"):
+            geom = geom.__geo_interface__
+        shapes.append(geom)
+
+    if not shapes:
+        return np.zeros(out_shape, dtype=np.int32)
+
+    from rasterio.enums import MergeAlg
+    from rasterio.features import rasterize
+
+    coverage = rasterize(
+        [(geom, 1) for geom in shapes],
+        out_shape=out_shape,
+        transform=transform,
+        fill=0,
+        dtype=np.uint16,
+        all_touched=all_touched,
+        merge_alg=MergeAlg.add,
+    )
+    if int(coverage.max()) > 1:
+        return None
+
+    return rasterize(
+        [(geom, index + 1) for index, geom in enumerate(shapes)],
+        out_shape=out_shape,
+        transform=transform,
+        fill=0,
+        dtype=np.int32,
+        all_touched=all_touched,
+    )
@@ -2,17 +2,22 @@ from __future__ import annotations
 
 import os
 import subprocess
+from functools import lru_cache
 from pathlib import Path
 
 DEFAULT_EXTERNAL_ROOT = Path("/Users/server/data/eudr-dmi")
 
 
+@lru_cache(maxsize=1)
 def repo_root() -> Path:
     """Return repository root.
 
     Preference order:
     1) `git rev-parse --show-toplevel` if available
     2) Walk parents from this file, looking for a repo marker
+
+    The result is cached for the life of the process so the `git` subprocess
+    runs at most once.
     """
 
     try:
@@ -2,6 +2,9 @@ from __future__ import annotations
 
 import hashlib
 import json
+import mmap
+import shutil
+from collections.abc import Mapping
 from datetime import datetime, timezone
 from pathlib import Path
 from zipfile import ZIP_DEFLATED, ZipInfo, ZipFile
@@ -34,6 +37,16 @@ def sha256_bytes(data: bytes) -> str:
 def sha256_file(path: Path, chunk_size: int = 1024 * 1024) -> str:
     h = hashlib.sha256()
     with path.open("rb") as f:
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if hasattr(mmap, "MADV_SEQUENTIAL"):
+                    # Let the kernel read ahead aggressively for the single pass.
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                h.update(mm)
+                return h.hexdigest()
+        except (OSError, ValueError):
+            # Empty files and non-regular files cannot be mapped.
+            pass
         for chunk in iter(lambda: f.read(chunk_size), b""):
             h.update(chunk)
     return h.hexdigest()
@@ -48,9 +61,13 @@ def write_json(path: Path, obj: object) -> None:
     write_bytes(path, canonical_json_bytes(obj) + b"\n")
 
 
-def create_deterministic_zip(zip_path: Path, files: dict[str, bytes]) -> None:
+def create_deterministic_zip(zip_path: Path, files: Mapping[str, bytes | Path]) -> None:
     """Create a deterministic zip (stable ordering + stable timestamps).
 
+    Values may be in-memory bytes or paths; paths are streamed into the
+    archive so large bundles never need to be held in memory. Both forms
+    produce identical archives for identical content.
+
     Note: determinism can still be affected by zip metadata and compression
     implementation differences across Python versions; this function minimizes
     variation in practice by controlling ordering and timestamps.
@@ -66,7 +83,13 @@ def create_deterministic_zip(zip_path: Path, files: dict[str, bytes]) -> None:
             info = ZipInfo(relpath)
             info.date_time = EPOCH_ZIP_DT
             info.compress_type = ZIP_DEFLATED
-            zf.writestr(info, content)
+            if isinstance(content, (bytes, bytearray)):
+                zf.writestr(info, content)
+                continue
+            # Mirror writestr: the declared size drives the zip64 decision.
+            info.file_size = content.stat().st_size
+            with content.open("rb") as src, zf.open(info, mode="w") as dest:
+                shutil.copyfileobj(src, dest, 1024 * 1024)
 
 
 def file_size_bytes(path: Path) -> int:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Mapping
 
@@ -8,6 +9,25 @@ import jsonschema
 from jsonschema import Draft202012Validator
 from jsonschema.exceptions import ValidationError
 
+try:  # Optional speed-up
+    import orjson  # type: ignore[import-not-found]
+
+    _HAS_ORJSON = True
+except Exception:
+    _HAS_ORJSON = False
+
+
+def _load_json_file(path: Path) -> Any:
+    data = path.read_bytes()
+    if _HAS_ORJSON:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson is stricter than json (NaN/Infinity literals, integers
+            # beyond 64 bits); defer to json so accepted input is unchanged.
+            pass
+    return json.loads(data.decode("utf-8"))
+
 
 def _find_repo_root(start: Path) -> Path:
     current = start
@@ -34,7 +54,15 @@ def _schema_path_for_version(report_version: str) -> Path:
 
 def load_schema(schema_path: str | Path | None = None) -> dict[str, Any]:
     path = Path(schema_path) if schema_path is not None else _default_schema_path()
-    return json.loads(path.read_text(encoding="utf-8"))
+    return _load_json_file(path)
+
+
+@lru_cache(maxsize=8)
+def _get_validator(schema_path: Path) -> Draft202012Validator:
+    # Parsing the schema and building the validator (ref resolution, format
+    # checker) dominates per-report cost in batch validation; build once per
+    # schema file. Validators are immutable, so sharing them is safe.
+    return Draft202012Validator(load_schema(schema_path), format_checker=jsonschema.FormatChecker())
 
 
 def validate_aoi_report_v1(
@@ -48,12 +76,12 @@ def validate_aoi_report_v1(
       jsonschema.exceptions.ValidationError if invalid.
     """
 
-    schema = load_schema(schema_path)
-    validator = Draft202012Validator(schema, format_checker=jsonschema.FormatChecker())
-    validator.validate(dict(report))
+    resolved_schema = Path(schema_path) if schema_path is not None else _default_schema_path()
+    report_obj = dict(report)
+    _get_validator(resolved_schema).validate(report_obj)
 
-    _validate_traceability(dict(report))
-    _validate_hansen_methodology(dict(report))
+    _validate_traceability(report_obj)
+    _validate_hansen_methodology(report_obj)
 
 
 def validate_aoi_report(
@@ -67,41 +95,42 @@ def validate_aoi_report(
         if schema_path is not None
         else _schema_path_for_version(report_version)
     )
-    schema = load_schema(resolved_schema)
-    validator = Draft202012Validator(schema, format_checker=jsonschema.FormatChecker())
-    validator.validate(dict(report))
+    report_obj = dict(report)
+    _get_validator(resolved_schema).validate(report_obj)
 
-    _validate_traceability(dict(report))
-    _validate_hansen_methodology(dict(report))
-    _validate_policy_mapping(dict(report))
+    _validate_traceability(report_obj)
+    _validate_hansen_methodology(report_obj)
+    _validate_policy_mapping(report_obj)
 
 
 def _validate_traceability(report: Mapping[str, Any]) -> None:
-    evidence_classes = {
+    evidence_classes = frozenset(
         item.get("class_id")
         for item in report.get("evidence_registry", {}).get("evidence_classes", [])
         if isinstance(item, Mapping)
-    }
-    acceptance_criteria = {
+    )
+    acceptance_criteria = frozenset(
         item.get("criteria_id")
         for item in report.get("acceptance_criteria", [])
         if isinstance(item, Mapping)
-    }
-    results = {
+    )
+    results = frozenset(
         item.get("result_id")
         for item in report.get("results", [])
         if isinstance(item, Mapping)
-    }
+    )
 
     traceability = report.get("regulatory_traceability", [])
 
     referenced_results: set[str] = set()
+    add_referenced = referenced_results.add
     for entry in traceability:
         if not isinstance(entry, Mapping):
             continue
-        evidence_class = entry.get("evidence_class")
-        criteria_id = entry.get("acceptance_criteria")
-        result_ref = entry.get("result_ref")
+        get = entry.get
+        evidence_class = get("evidence_class")
+        criteria_id = get("acceptance_criteria")
+        result_ref = get("result_ref")
 
         if evidence_class and evidence_class not in evidence_classes:
             raise ValidationError(
@@ -116,16 +145,16 @@ def _validate_traceability(report: Mapping[str, Any]) -> None:
                 f"Traceability references unknown result_ref: {result_ref}"
             )
         if isinstance(result_ref, str):
-            referenced_results.add(result_ref)
+            add_referenced(result_ref)
 
-    orphaned_results = sorted(r for r in results if r not in referenced_results)
+    orphaned_results = results - referenced_results
     if orphaned_results:
-        raise ValidationError(f"Orphaned results without traceability: {orphaned_results}")
+        raise ValidationError(f"Orphaned results without traceability: {sorted(orphaned_results)}")
 
     _validate_assumptions(report, results)
 
 
-def _validate_assumptions(report: Mapping[str, Any], results: set[str]) -> None:
+def _validate_assumptions(report: Mapping[str, Any], results: frozenset[str]) -> None:
     assumptions = report.get("assumptions", [])
     assumption_ids: set[str] = set()
     non_testable_result_ids: set[str] = set()
@@ -330,7 +359,7 @@ def validate_aoi_report_v1_file(
 ) -> dict[str, Any]:
     """Load and validate a report JSON file; returns the parsed JSON."""
 
-    obj = json.loads(Path(json_path).read_text(encoding="utf-8"))
+    obj = _load_json_file(Path(json_path))
     validate_aoi_report_v1(obj, schema_path=schema_path)
     return obj
 
@@ -340,6 +369,6 @@ def validate_aoi_report_file(
     *,
     schema_path: str | Path | None = None,
 ) -> dict[str, Any]:
-    obj = json.loads(Path(json_path).read_text(encoding="utf-8"))
+    obj = _load_json_file(Path(json_path))
     validate_aoi_report(obj, schema_path=schema_path)
     return obj
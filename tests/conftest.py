@@ -1,8 +1,229 @@
 from __future__ import annotations
 
+import importlib.util
+import io
+import json
+import shutil
 import sys
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from functools import cache
 from pathlib import Path
+from types import ModuleType
 
-_SRC = (Path(__file__).resolve().parents[1] / "src").as_posix()
+import pytest
+
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+_SRC = (_REPO_ROOT / "src").as_posix()
 if _SRC not in sys.path:
     sys.path.insert(0, _SRC)
+
+
+@cache
+def _load_script_module(path: str, name: str) -> ModuleType:
+    spec = importlib.util.spec_from_file_location(name, path)
+    if spec is None or spec.loader is None:
+        raise RuntimeError(f"Unable to load module: {path}")
+    module = importlib.util.module_from_spec(spec)
+    # Dataclasses resolve annotations through sys.modules.
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope="session")
+def script_loader() -> Callable[[Path, str], ModuleType]:
+    """Load a `scripts/*.py` module once per session.
+
+    Tests share the module object, so patch its attributes with `monkeypatch`
+    (which restores them) rather than assigning to them directly.
+    """
+
+    def _load(path: Path, name: str) -> ModuleType:
+        return _load_script_module(str(path), name)
+
+    return _load
+
+
+@dataclass(frozen=True)
+class AoiBundle:
+    evidence_root: Path
+    bundle_dir: Path
+    aoi_id: str
+    bundle_id: str
+    report_json: Path
+    report_html: Path
+
+    @property
+    def bundle_date(self) -> date:
+        return date.fromisoformat(self.bundle_dir.parent.name)
+
+
+@pytest.fixture(scope="session")
+def frozen_utc_now() -> datetime:
+    """One UTC timestamp for the whole session.
+
+    Pass it to the reports CLI via EUDR_DMI_GENERATED_AT_UTC so bundle dates
+    cannot straddle midnight between generation and assertions.
+    """
+
+    return datetime.now(timezone.utc).replace(microsecond=0)
+
+
+@pytest.fixture(scope="session")
+def aoi_bundle(tmp_path_factory: pytest.TempPathFactory, frozen_utc_now: datetime) -> AoiBundle:
+    """Generate one point-AOI evidence bundle shared by read-only tests.
+
+    Tests that need their own AOI inputs should keep generating their own.
+    """
+
+    from eudr_dmi_gil.reports.cli import main as aoi_cli_main
+
+    evidence_root = tmp_path_factory.mktemp("evidence")
+    aoi_id = "aoi-123"
+    bundle_id = "bundle-001"
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("EUDR_DMI_EVIDENCE_ROOT", str(evidence_root))
+        mp.setenv("EUDR_DMI_GENERATED_AT_UTC", frozen_utc_now.isoformat())
+        rc = aoi_cli_main(
+            [
+                "--aoi-id",
+                aoi_id,
+                "--aoi-wkt",
+                "POINT (0 0)",
+                "--bundle-id",
+                bundle_id,
+                "--out-format",
+                "both",
+                "--metric",
+                "b_metric=2:count:src:note b",
+                "--metric",
+                "a_metric=1:count:src:note a",
+            ]
+        )
+    assert rc == 0
+
+    bundle_dir = evidence_root / frozen_utc_now.date().isoformat() / bundle_id
+    report_dir = bundle_dir / "reports" / "aoi_report_v2"
+    return AoiBundle(
+        evidence_root=evidence_root,
+        bundle_dir=bundle_dir,
+        aoi_id=aoi_id,
+        bundle_id=bundle_id,
+        report_json=report_dir / f"{aoi_id}.json",
+        report_html=report_dir / f"{aoi_id}.html",
+    )
+
+
+# Single-tile AOI (N50_E020) used by the Hansen bootstrap tests.
+_HANSEN_AOI_GEOJSON = {
+    "type": "FeatureCollection",
+    "features": [
+        {
+            "type": "Feature",
+            "properties": {},
+            "geometry": {
+                "type": "Polygon",
+                "coordinates": [
+                    [
+                        [20.1, 50.1],
+                        [20.9, 50.1],
+                        [20.9, 50.9],
+                        [20.1, 50.9],
+                        [20.1, 50.1],
+                    ]
+                ],
+            },
+        }
+    ],
+}
+
+
+class _FakeUrlopenResponse:
+    def __init__(self, data: bytes) -> None:
+        self._buf = io.BytesIO(data)
+
+    def read(self, size: int = -1) -> bytes:
+        return self._buf.read(size)
+
+    def __enter__(self) -> _FakeUrlopenResponse:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        return None
+
+
+@pytest.fixture(scope="session")
+def aoi_geojson_bytes() -> bytes:
+    return json.dumps(_HANSEN_AOI_GEOJSON).encode("utf-8")
+
+
+@pytest.fixture
+def aoi_geojson_path(tmp_path: Path, aoi_geojson_bytes: bytes) -> Path:
+    path = tmp_path / "aoi.geojson"
+    path.write_bytes(aoi_geojson_bytes)
+    return path
+
+
+@pytest.fixture(scope="session")
+def fake_urlopen() -> Callable[..., _FakeUrlopenResponse]:
+    """A `urlopen` stand-in that serves `b"tile-bytes"` for every URL."""
+
+    def _fake_urlopen(url: str) -> _FakeUrlopenResponse:
+        return _FakeUrlopenResponse(b"tile-bytes")
+
+    return _fake_urlopen
+
+
+_DATA_DB_SEEDS = {
+    "dataset_catalogue_auto.csv": ("dataset_id,name", ["ds-1,Example"]),
+    "dataset_families_summary.csv": ("dataset_id,family", ["ds-1,Example"]),
+    "dependency_sources.csv": (
+        "dependency_id,url,expected_content_type,server_audit_path,description,family_or_tag,used_by",
+        [
+            "b_dep,https://example.org/b,text/html,/audit/b,B dep,tag-a,src/b.py",
+            "a_dep,https://example.org/a,application/json,/audit/a,A dep,tag-b,src/a.py",
+        ],
+    ),
+}
+
+
+@pytest.fixture(scope="session")
+def seed_data_db(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Minimal `data_db/` seed CSVs, written once per session. Treat as read-only."""
+
+    data_db = tmp_path_factory.mktemp("seed_data_db")
+    for filename, (header, rows) in _DATA_DB_SEEDS.items():
+        (data_db / filename).write_text("\n".join([header, *rows]) + "\n", encoding="utf-8")
+    return data_db
+
+
+@pytest.fixture(scope="session")
+def bootstrapped_data_db(
+    tmp_path_factory: pytest.TempPathFactory, seed_data_db: Path, script_loader
+) -> Path:
+    """Run `scripts/bootstrap_data_db.py` once over the seed; returns the repo root.
+
+    Treat as read-only; use `bootstrapped_data_db_repo` for a writable copy.
+    """
+
+    pytest.importorskip("duckdb")
+    bootstrap_data_db = script_loader(
+        _REPO_ROOT / "scripts" / "bootstrap_data_db.py", "bootstrap_data_db"
+    )
+    repo_root = tmp_path_factory.mktemp("bootstrapped_repo")
+    shutil.copytree(seed_data_db, repo_root / "data_db")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(bootstrap_data_db, "repo_root", lambda: repo_root)
+        assert bootstrap_data_db.main(["--data-dir", "data_db"]) == 0
+    return repo_root
+
+
+@pytest.fixture
+def bootstrapped_data_db_repo(tmp_path: Path, bootstrapped_data_db: Path) -> Path:
+    """A writable repo root whose `data_db/` holds the seed CSVs and DuckDB catalogue."""
+
+    shutil.copytree(bootstrapped_data_db / "data_db", tmp_path / "data_db")
+    return tmp_path
@@ -4,6 +4,8 @@ from pathlib import Path
 
 import importlib.util
 
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+
 
 class TestBootstrapDataDb(unittest.TestCase):
     def test_bootstrap_from_csv_seeds_creates_tables(self) -> None:
@@ -28,9 +30,7 @@ class TestBootstrapDataDb(unittest.TestCase):
             )
 
             # Load the real bootstrap script (scripts/ is not a Python package).
-            bootstrap_path = (
-                Path(__file__).resolve().parents[1] / "scripts" / "bootstrap_data_db.py"
-            )
+            bootstrap_path = _REPO_ROOT / "scripts" / "bootstrap_data_db.py"
             spec = importlib.util.spec_from_file_location(
                 "bootstrap_data_db", str(bootstrap_path)
             )
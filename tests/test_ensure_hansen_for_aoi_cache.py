@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def test_ensure_hansen_for_aoi_reuses_cached_manifest(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, script_loader
+) -> None:
+    script = script_loader(
+        _REPO_ROOT / "scripts" / "ensure_hansen_for_aoi.py",
+        "ensure_hansen_for_aoi_script",
+    )
+    monkeypatch.setenv("EUDR_DMI_DATA_ROOT", str(tmp_path / "external"))
+
+    aoi_path = tmp_path / "aoi.geojson"
+    aoi_path.write_text('{"type":"FeatureCollection","features":[]}', encoding="utf-8")
+    tile_path = tmp_path / "tile.tif"
+    tile_path.write_bytes(b"tile")
+
+    calls: list[str] = []
+
+    def _fake_ensure(**kwargs):
+        calls.append(kwargs["aoi_id"])
+        manifest_path = tmp_path / "tiles_manifest.json"
+        manifest_path.write_text(
+            json.dumps({"entries": [{"local_path": str(tile_path)}]}), encoding="utf-8"
+        )
+        return manifest_path
+
+    monkeypatch.setattr(script, "ensure_hansen_for_aoi", _fake_ensure)
+    argv = ["--aoi-id", "aoi-1", "--aoi-geojson", str(aoi_path), "--offline"]
+
+    assert script.main(argv) == 0
+    assert script.main(argv) == 0
+    assert calls == ["aoi-1"]
+
+    # Forced refresh and a missing tile both bypass the cache.
+    assert script.main([*argv, "--refresh"]) == 0
+    tile_path.unlink()
+    assert script.main(argv) == 0
+    assert calls == ["aoi-1", "aoi-1", "aoi-1"]
+
+
+def test_ensure_hansen_for_aoi_cache_tracks_inputs(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, script_loader
+) -> None:
+    script = script_loader(
+        _REPO_ROOT / "scripts" / "ensure_hansen_for_aoi.py",
+        "ensure_hansen_for_aoi_script",
+    )
+    monkeypatch.setenv("EUDR_DMI_DATA_ROOT", str(tmp_path / "external"))
+    monkeypatch.delenv("EUDR_DMI_HANSEN_URL_TEMPLATE", raising=False)
+
+    tile_path = tmp_path / "tile.tif"
+    tile_path.write_bytes(b"tile")
+    aoi_a = tmp_path / "a.geojson"
+    aoi_a.write_text('{"type":"FeatureCollection","features":[],"name":"a"}', encoding="utf-8")
+    aoi_b = tmp_path / "b.geojson"
+    aoi_b.write_text('{"type":"FeatureCollection","features":[],"name":"b"}', encoding="utf-8")
+
+    calls: list[dict] = []
+
+    def _fake_ensure(**kwargs):
+        calls.append(kwargs)
+        # Like the real bootstrap, every run for an AOI id shares one path.
+        manifest_path = tmp_path / "tiles_manifest.json"
+        manifest_path.write_text(
+            json.dumps(
+                {
+                    "aoi": kwargs["aoi_geojson_path"].name,
+                    "entries": [{"local_path": str(tile_path)}],
+                }
+            ),
+            encoding="utf-8",
+        )
+        return manifest_path
+
+    monkeypatch.setattr(script, "ensure_hansen_for_aoi", _fake_ensure)
+
+    def _run(aoi: Path, *extra: str) -> None:
+        assert script.main(["--aoi-id", "aoi-1", "--aoi-geojson", str(aoi), *extra]) == 0
+
+    # b overwrote the shared manifest, so a must be resolved again.
+    _run(aoi_a)
+    _run(aoi_b)
+    _run(aoi_a)
+    assert len(calls) == 3
+    manifest = json.loads((tmp_path / "tiles_manifest.json").read_text(encoding="utf-8"))
+    assert manifest["aoi"] == "a.geojson"
+
+    # Different flags or URL template are separate cache entries.
+    _run(aoi_a, "--no-download")
+    monkeypatch.setenv(
+        "EUDR_DMI_HANSEN_URL_TEMPLATE", "https://mirror.example/{layer}_{tile_id}.tif"
+    )
+    _run(aoi_a)
+    assert len(calls) == 5
+
+    # MinIO runs always resolve so the manifest gets uploaded.
+    _run(aoi_a, "--minio-cache")
+    _run(aoi_a, "--minio-cache")
+    assert len(calls) == 7
@@ -1,57 +1,51 @@
 from __future__ import annotations
 
 import json
-import os
-import subprocess
-import sys
-from datetime import datetime, timezone
+from datetime import datetime
 from pathlib import Path
 
 import pytest
 
+_REPO_ROOT = Path(__file__).resolve().parents[1]
 
-def _run_cli(args: list[str], *, env: dict[str, str]) -> subprocess.CompletedProcess[str]:
-    return subprocess.run(
-        [sys.executable, "-m", "eudr_dmi_gil.reports.cli", *args],
-        check=False,
-        text=True,
-        capture_output=True,
-        env=env,
-    )
 
-
-def test_estonia_testland1_geojson_smoke(tmp_path: Path) -> None:
-    repo_root = Path(__file__).resolve().parents[1]
-    geojson_path = repo_root / "aoi_json_examples" / "estonia_testland1.geojson"
+@pytest.mark.slow
+def test_estonia_testland1_geojson_smoke(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, frozen_utc_now: datetime
+) -> None:
+    geojson_path = _REPO_ROOT / "aoi_json_examples" / "estonia_testland1.geojson"
     if not geojson_path.is_file():
         pytest.skip("estonia_testland1.geojson not found")
 
     evidence_root = tmp_path / "evidence"
-    env = os.environ.copy()
-    env["EUDR_DMI_EVIDENCE_ROOT"] = str(evidence_root)
+    monkeypatch.setenv("EUDR_DMI_EVIDENCE_ROOT", str(evidence_root))
+    monkeypatch.setenv("EUDR_DMI_GENERATED_AT_UTC", frozen_utc_now.isoformat())
 
     bundle_id = "estonia_testland1-smoke"
     aoi_id = "estonia_testland1"
 
-    proc = _run_cli(
-        [
-            "--aoi-id",
-            aoi_id,
-            "--aoi-geojson",
-            str(geojson_path),
-            "--bundle-id",
-            bundle_id,
-            "--out-format",
-            "both",
-        ],
-        env=env,
-    )
-
-    if proc.returncode != 0:
-        pytest.skip(f"CLI failed (environment prerequisites missing): {proc.stderr}")
-
-    bundle_date = datetime.now(timezone.utc).date().strftime("%Y-%m-%d")
-    bundle_dir = evidence_root / bundle_date / bundle_id
+    try:
+        from eudr_dmi_gil.reports.cli import main as aoi_cli_main
+
+        rc = aoi_cli_main(
+            [
+                "--aoi-id",
+                aoi_id,
+                "--aoi-geojson",
+                str(geojson_path),
+                "--bundle-id",
+                bundle_id,
+                "--out-format",
+                "both",
+            ]
+        )
+    except (ImportError, OSError, RuntimeError) as exc:
+        # Missing optional modules, data tiles, credentials or network access.
+        pytest.skip(f"CLI failed (environment prerequisites missing): {exc}")
+    if rc != 0:
+        pytest.skip(f"CLI failed (environment prerequisites missing): exit code {rc}")
+
+    bundle_dir = evidence_root / frozen_utc_now.date().isoformat() / bundle_id
 
     report_json = bundle_dir / "reports" / "aoi_report_v2" / f"{aoi_id}.json"
     report_html = bundle_dir / "reports" / "aoi_report_v2" / f"{aoi_id}.html"
@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+@pytest.fixture
+def exporter(script_loader):
+    return script_loader(
+        _REPO_ROOT / "scripts" / "export_aoi_reports_staging.py",
+        "export_aoi_reports_staging",
+    )
+
+
+def _write_evidence_bundle(evidence_root: Path) -> Path:
+    bundle_root = evidence_root / "2026-01-01" / "bundle-001"
+    report_dir = bundle_root / "reports" / "aoi_report_v2"
+    report_dir.mkdir(parents=True)
+    (bundle_root / "inputs").mkdir()
+    (bundle_root / "inputs" / "aoi.geojson").write_text('{"type":"FeatureCollection"}\n')
+    (report_dir / "aoi-1").mkdir()
+    (report_dir / "aoi-1" / "metrics.csv").write_text("variable,value\n")
+    (report_dir / "aoi-1.html").write_text("<html></html>\n")
+
+    report = {
+        "aoi_id": "aoi-1",
+        "bundle_id": "bundle-001",
+        "generated_at_utc": "2026-01-01T00:00:00+00:00",
+        "aoi_geometry_ref": {"kind": "geojson", "value": "inputs/aoi.geojson"},
+        "inputs": {"sources": [{"uri": "inputs/aoi.geojson"}]},
+        "evidence_artifacts": [
+            {"relpath": "reports/aoi_report_v2/aoi-1/metrics.csv"},
+            {"relpath": "missing/file.txt"},
+        ],
+        "forest_metrics": {"rfm_area_ha": 1.5, "loss_2021_2024_ha": 0.25},
+        "extensions": {
+            "forest_metrics_params": {"threshold": 30, "label": "Loss 2021–2024"},
+            "forest_metrics_debug": {"pixels": [1, 2, 3]},
+        },
+    }
+    (report_dir / "aoi-1.json").write_text(json.dumps(report), encoding="utf-8")
+    return bundle_root
+
+
+def test_export_aoi_reports_stages_single_run(tmp_path: Path, exporter) -> None:
+    evidence_root = tmp_path / "evidence"
+    _write_evidence_bundle(evidence_root)
+    output_root = tmp_path / "staging"
+
+    exporter.export_aoi_reports(
+        evidence_root=evidence_root,
+        output_root=output_root,
+        staged_run_id="example",
+        report_json_filename="aoi_report.json",
+    )
+
+    run_dir = output_root / "runs" / "example"
+    assert (output_root / "index.html").is_file()
+    assert (run_dir / "report.html").is_file()
+    assert (run_dir / "inputs" / "aoi.geojson").is_file()
+    assert (run_dir / "reports" / "aoi_report_v2" / "aoi-1" / "metrics.csv").is_file()
+    assert (run_dir / "reports" / "aoi_report_v2" / "aoi-1.html").is_file()
+    assert not (run_dir / "missing").exists()
+
+    staged = json.loads((run_dir / "aoi_report.json").read_text(encoding="utf-8"))
+    assert staged["extensions"]["forest_metrics_artifacts"] == {
+        "debug_ref": "forest_metrics_debug.json",
+        "params_ref": "forest_metrics_params.json",
+    }
+    params = json.loads((run_dir / "forest_metrics_params.json").read_text(encoding="utf-8"))
+    assert params == {"label": "Loss 2021–2024", "threshold": 30}
+
+    html = (run_dir / "report.html").read_text(encoding="utf-8")
+    assert "AOI geometry" in html
+    assert "Metrics CSV" in html
+
+
+def test_export_aoi_reports_generated_files_win_over_artifacts(tmp_path: Path, exporter) -> None:
+    evidence_root = tmp_path / "evidence"
+    bundle_root = _write_evidence_bundle(evidence_root)
+    report_path = bundle_root / "reports" / "aoi_report_v2" / "aoi-1.json"
+    report = json.loads(report_path.read_text(encoding="utf-8"))
+    for name in ["report.html", "aoi_report.json", "forest_metrics_params.json"]:
+        (bundle_root / name).write_text("stale artifact\n", encoding="utf-8")
+        report["evidence_artifacts"].append({"relpath": name})
+    report_path.write_text(json.dumps(report), encoding="utf-8")
+
+    output_root = tmp_path / "staging"
+    exporter.export_aoi_reports(
+        evidence_root=evidence_root,
+        output_root=output_root,
+        staged_run_id="example",
+        report_json_filename="aoi_report.json",
+    )
+
+    run_dir = output_root / "runs" / "example"
+    assert "AOI geometry" in (run_dir / "report.html").read_text(encoding="utf-8")
+    staged = json.loads((run_dir / "aoi_report.json").read_text(encoding="utf-8"))
+    assert staged["aoi_id"] == "aoi-1"
+    params = json.loads((run_dir / "forest_metrics_params.json").read_text(encoding="utf-8"))
+    assert params == {"label": "Loss 2021–2024", "threshold": 30}
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {"b": [1, 2.5, {"x": "Loss 2021–2024"}], "a": {}, "n": None},
+        {"small": 0.00001, "big": 1e16, "nan": float("nan"), "inf": float("inf")},
+        {"ascii": "plain", "nested": [[], {}, 0.25, True]},
+        {2: "int keys", 1: [0.5]},
+    ],
+)
+def test_write_json_is_identical_with_and_without_orjson(
+    tmp_path: Path, monkeypatch, exporter, payload
+) -> None:
+    from eudr_dmi.reports import io as report_io
+
+    exporter._write_json(tmp_path / "fast.json", payload)
+    monkeypatch.setattr(report_io, "_HAS_ORJSON", False)
+    exporter._write_json(tmp_path / "stdlib.json", payload)
+
+    fast = (tmp_path / "fast.json").read_bytes()
+    assert fast == (tmp_path / "stdlib.json").read_bytes()
+    # Same bytes as the original json.dumps(..., indent=2, sort_keys=True) writer.
+    assert fast == (json.dumps(payload, indent=2, sort_keys=True) + "\n").encode("utf-8")
+
+
+def test_fast_copy_preserves_content_and_mtime(tmp_path: Path, exporter) -> None:
+    src = tmp_path / "src.bin"
+    src.write_bytes(bytes(range(256)) * 1024)
+    os.utime(src, ns=(1_600_000_000_000_000_000, 1_600_000_000_000_000_000))
+
+    dest = tmp_path / "dest.bin"
+    exporter._fast_copy(src, dest)
+
+    assert dest.read_bytes() == src.read_bytes()
+    assert dest.stat().st_mtime_ns == src.stat().st_mtime_ns
+
+
+def test_find_report_jsons_matches_rglob(tmp_path: Path, exporter) -> None:
+    for relpath in [
+        "2026-01-01/b1/reports/aoi_report_v2/a.json",
+        "2026-01-01/b1/reports/aoi_report_v2/a/metrics.json",
+        "2026-01-02/b2/reports/aoi_report_v1/b.json",
+        "2026-01-02/b2/reports/aoi_report_v1/b.html",
+        "loose/reports/aoi_report_v2/c.json",
+    ]:
+        path = tmp_path / relpath
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("{}", encoding="utf-8")
+
+    # A symlink cycle back to the root and a plain alias of a bundle must not
+    # be walked (rglob does not follow them either).
+    (tmp_path / "2026-01-01" / "b1" / "loop").symlink_to(tmp_path, target_is_directory=True)
+    (tmp_path / "alias").symlink_to(tmp_path / "2026-01-02", target_is_directory=True)
+    (tmp_path / "linked").mkdir()
+    (tmp_path / "linked" / "reports").symlink_to(
+        tmp_path / "loose" / "reports", target_is_directory=True
+    )
+
+    found = exporter._find_report_jsons(tmp_path)
+    for version in ("aoi_report_v2", "aoi_report_v1"):
+        assert found[version] == sorted(tmp_path.rglob(f"reports/{version}/*.json"))
+    assert exporter._find_report_jsons(tmp_path / "missing") == {
+        "aoi_report_v2": [],
+        "aoi_report_v1": [],
+    }
+
+
+def test_write_index_consumes_entries_lazily(tmp_path: Path, exporter) -> None:
+
+    def _entries():
+        for i in range(3):
+            yield exporter.RunEntry(
+                run_id=f"run-{i}",
+                report_html_path=tmp_path / "report.html",
+                report_json_path=tmp_path / "aoi_report.json",
+                summary_present=i == 1,
+            )
+
+    index = tmp_path / "index.html"
+    exporter._write_index(index, _entries(), report_json_filename="aoi_report.json")
+    html = index.read_text(encoding="utf-8")
+    assert [f'href="runs/run-{i}/report.html"' in html for i in range(3)] == [True] * 3
+    assert html.count("summary.json</a>") == 1
+    assert "(none)" not in html
+
+    exporter._write_index(index, iter(()), report_json_filename="aoi_report.json")
+    assert "<li>(none)</li>" in index.read_text(encoding="utf-8")
+
+
+def test_export_aoi_reports_swaps_output_atomically(tmp_path: Path, exporter) -> None:
+    evidence_root = tmp_path / "evidence"
+    _write_evidence_bundle(evidence_root)
+    output_root = tmp_path / "staging"
+    kwargs = {
+        "evidence_root": evidence_root,
+        "output_root": output_root,
+        "report_json_filename": "aoi_report.json",
+    }
+
+    assert exporter.export_aoi_reports(staged_run_id="first", **kwargs) is None
+    # A stale replaced tree from an interrupted run must not break the swap.
+    stale = tmp_path / f"staging.old.{os.getpid()}"
+    (stale / "runs" / "stale").mkdir(parents=True)
+    cleanup = exporter.export_aoi_reports(staged_run_id="second", **kwargs)
+    assert cleanup is not None
+    cleanup.join()
+
+    assert sorted(p.name for p in (output_root / "runs").iterdir()) == ["second"]
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["evidence", "staging"]
+
+    # A failed export leaves the previous output in place.
+    with pytest.raises(SystemExit):
+        exporter.export_aoi_reports(
+            staged_run_id="third", **{**kwargs, "evidence_root": tmp_path / "missing"}
+        )
+    assert sorted(p.name for p in (output_root / "runs").iterdir()) == ["second"]
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["evidence", "staging"]
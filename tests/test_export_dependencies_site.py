@@ -1,22 +1,13 @@
 from __future__ import annotations
 
-import importlib.util
 from pathlib import Path
 
+_REPO_ROOT = Path(__file__).resolve().parents[1]
 
-def _load_script_module(path: Path, name: str):
-    spec = importlib.util.spec_from_file_location(name, path)
-    if spec is None or spec.loader is None:
-        raise RuntimeError(f"Unable to load module: {path}")
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
-    return module
 
-
-def test_export_dependencies_site(tmp_path: Path, monkeypatch) -> None:
-    script_repo = Path(__file__).resolve().parents[1]
-    exporter = _load_script_module(
-        script_repo / "scripts" / "export_dependencies_site.py",
+def test_export_dependencies_site(tmp_path: Path, monkeypatch, script_loader) -> None:
+    exporter = script_loader(
+        _REPO_ROOT / "scripts" / "export_dependencies_site.py",
         "export_dependencies_site",
     )
 
@@ -34,3 +25,29 @@ def test_export_dependencies_site(tmp_path: Path, monkeypatch) -> None:
     assert (site_deps / "flow.html").exists()
     assert (site_deps / "sources.html").exists()
     assert (site_deps / "index.html").exists()
+
+
+def test_render_markdown_basic_blocks(script_loader) -> None:
+    exporter = script_loader(
+        _REPO_ROOT / "scripts" / "export_dependencies_site.py",
+        "export_dependencies_site",
+    )
+
+    text = (
+        "# Title\n### Sub <x>\n#### Deep\nstill deep\n- a\n* b\n\n"
+        "```\n# code & more\n```\ntail"
+    )
+    assert exporter._render_markdown_basic(text).split("\n") == [
+        "<h1>Title</h1>",
+        "<h3>Sub &lt;x&gt;</h3>",
+        "<p>#### Deep",
+        "still deep</p>",
+        "<ul>",
+        "<li>a</li>",
+        "<li>b</li>",
+        "</ul>",
+        "<pre><code>",
+        "# code &amp; more",
+        "</code></pre>",
+        "<p>tail</p>",
+    ]
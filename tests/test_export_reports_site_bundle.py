@@ -1,40 +1,19 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
 from pathlib import Path
 
-from eudr_dmi_gil.reports.cli import main as aoi_cli_main
-from eudr_dmi_gil.reports.site_bundle_export import ExportPaths, export_site_bundle_reports
-
-
-def test_site_bundle_zip_sha256_deterministic(tmp_path: Path, monkeypatch) -> None:
-    # Create a fixed evidence root and a fixed bundle on today's UTC date.
-    evidence_root = tmp_path / "evidence"
-    monkeypatch.setenv("EUDR_DMI_EVIDENCE_ROOT", str(evidence_root))
+import pytest
 
-    bundle_id = "bundle-001"
-    aoi_id = "aoi-123"
+from eudr_dmi_gil.reports import site_bundle_export
+from eudr_dmi_gil.reports.site_bundle_export import ExportPaths, export_site_bundle_reports
 
-    # Generate a deterministic bundle (explicit bundle id, fixed metric rows ordering).
-    rc = aoi_cli_main(
-        [
-            "--aoi-id",
-            aoi_id,
-            "--aoi-wkt",
-            "POINT (0 0)",
-            "--bundle-id",
-            bundle_id,
-            "--out-format",
-            "both",
-            "--metric",
-            "b_metric=2:count:src:note b",
-            "--metric",
-            "a_metric=1:count:src:note a",
-        ]
-    )
-    assert rc == 0
 
-    bundle_date = datetime.now(timezone.utc).date()
+@pytest.mark.slow
+def test_site_bundle_zip_sha256_deterministic(tmp_path: Path, aoi_bundle) -> None:
+    # A fixed bundle (explicit bundle id, fixed metric rows ordering) from the shared fixture.
+    evidence_root = aoi_bundle.evidence_root
+    bundle_id = aoi_bundle.bundle_id
+    bundle_date = aoi_bundle.bundle_date
 
     out_base = tmp_path / "docs"
     paths = ExportPaths(
@@ -72,3 +51,17 @@ def test_site_bundle_zip_sha256_deterministic(tmp_path: Path, monkeypatch) -> No
     # Bundle path should be preserved within the portable folder.
     expected_bundle_dir = paths.out_dir / bundle_date.strftime("%Y-%m-%d") / bundle_id
     assert expected_bundle_dir.exists()
+
+
+def test_copy_tree_follows_symlinks(tmp_path: Path) -> None:
+    src = tmp_path / "src"
+    (src / "reports").mkdir(parents=True)
+    (tmp_path / "outside.txt").write_text("linked\n", encoding="utf-8")
+    (src / "reports" / "link.txt").symlink_to(tmp_path / "outside.txt")
+
+    dest = tmp_path / "dest"
+    site_bundle_export._copy_tree(src, dest)
+
+    copied = dest / "reports" / "link.txt"
+    assert not copied.is_symlink()
+    assert copied.read_text(encoding="utf-8") == "linked\n"
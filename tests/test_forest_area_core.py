@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from eudr_dmi_gil.geo import forest_area_core
+
+
+@pytest.mark.parametrize(
+    ("name", "args"),
+    [
+        ("forest_mask_end_year", (30, 2024)),
+        ("forest_mask_end_year", (30, 1995)),
+        ("loss_mask_range", (30, 2021, 2024)),
+        ("loss_total_mask", (30,)),
+        ("forest_2024_mask", (30,)),
+    ],
+)
+def test_mask_helpers_match_numpy_reference(monkeypatch, name: str, args: tuple[int, ...]) -> None:
+    rng = np.random.default_rng(0)
+    treecover = rng.integers(0, 101, (64, 80), dtype=np.uint8)
+    lossyear = np.where(rng.random((64, 80)) < 0.3, rng.integers(1, 25, (64, 80)), 0).astype(np.uint8)
+    # A strided window exercises non-contiguous input.
+    treecover, lossyear = treecover[3:60, 1:77:2], lossyear[3:60, 1:77:2]
+
+    fn = getattr(forest_area_core, name)
+    result = fn(treecover, lossyear, *args)
+    monkeypatch.setattr(forest_area_core, "_numba_kernels", lambda: None)
+    expected = fn(treecover, lossyear, *args)
+
+    assert result.dtype == np.bool_
+    assert np.array_equal(result, expected)
+
+
+@pytest.mark.parametrize("shape", [(37,), (12, 17), (3, 8, 9)])
+def test_zonal_area_ha_accepts_any_ndim(shape: tuple[int, ...]) -> None:
+    rng = np.random.default_rng(1)
+    mask = rng.random(shape) < 0.5
+    zone = rng.random(shape) < 0.7
+    pixel_area = rng.uniform(800.0, 900.0, shape)
+
+    expected = float(np.sum(pixel_area[mask & zone], dtype=np.float64)) / 10_000.0
+    assert forest_area_core.zonal_area_ha(mask, pixel_area, zone) == pytest.approx(expected, rel=1e-12)
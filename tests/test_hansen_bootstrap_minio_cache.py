@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-import io
-import json
+import hashlib
 from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
 
@@ -11,52 +11,9 @@ from eudr_dmi_gil.deps.hansen_bootstrap import ensure_hansen_for_aoi
 from eudr_dmi_gil.deps import minio_cache
 
 
-def _fake_urlopen_factory(payload: bytes):
-    class _Response:
-        def __init__(self, data: bytes) -> None:
-            self._buf = io.BytesIO(data)
-
-        def read(self, size: int = -1) -> bytes:
-            return self._buf.read(size)
-
-        def __enter__(self) -> "_Response":
-            return self
-
-        def __exit__(self, exc_type, exc, tb) -> None:
-            return None
-
-    def _fake_urlopen(url: str):  # noqa: ANN001
-        return _Response(payload)
-
-    return _fake_urlopen
-
-
-def _write_aoi_geojson(path: Path) -> None:
-    geojson = {
-        "type": "FeatureCollection",
-        "features": [
-            {
-                "type": "Feature",
-                "properties": {},
-                "geometry": {
-                    "type": "Polygon",
-                    "coordinates": [
-                        [
-                            [20.1, 50.1],
-                            [20.9, 50.1],
-                            [20.9, 50.9],
-                            [20.1, 50.9],
-                            [20.1, 50.1],
-                        ]
-                    ],
-                },
-            }
-        ],
-    }
-    path.write_text(json.dumps(geojson), encoding="utf-8")
-
-
-def test_hansen_bootstrap_minio_cache(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+def test_hansen_bootstrap_minio_cache(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, aoi_geojson_path: Path, fake_urlopen
+) -> None:
     monkeypatch.setenv("EUDR_DMI_DATA_ROOT", str(tmp_path))
     monkeypatch.setenv(
         "EUDR_DMI_HANSEN_URL_TEMPLATE",
@@ -68,11 +25,7 @@ def test_hansen_bootstrap_minio_cache(monkeypatch: pytest.MonkeyPatch, tmp_path:
     monkeypatch.setenv("MINIO_SECRET_KEY", "secret")
     monkeypatch.setenv("MINIO_BUCKET", "cache")
 
-    monkeypatch.setattr(
-        hansen_acquire.urllib.request,
-        "urlopen",
-        _fake_urlopen_factory(b"tile-bytes"),
-    )
+    monkeypatch.setattr(hansen_acquire.urllib.request, "urlopen", fake_urlopen)
 
     calls: dict[str, list[tuple[str, str]]] = {"put": [], "get": [], "bucket": []}
 
@@ -90,12 +43,9 @@ def test_hansen_bootstrap_minio_cache(monkeypatch: pytest.MonkeyPatch, tmp_path:
     monkeypatch.setattr(minio_cache, "get_file_if_exists", _get_file)
     monkeypatch.setattr(minio_cache, "put_file", _put_file)
 
-    aoi_path = tmp_path / "aoi.geojson"
-    _write_aoi_geojson(aoi_path)
-
     manifest_path = ensure_hansen_for_aoi(
         aoi_id="test_aoi",
-        aoi_geojson_path=aoi_path,
+        aoi_geojson_path=aoi_geojson_path,
         layers=["treecover2000", "lossyear"],
         download=True,
         minio_cache_enabled=True,
@@ -106,4 +56,93 @@ def test_hansen_bootstrap_minio_cache(monkeypatch: pytest.MonkeyPatch, tmp_path:
     assert calls["bucket"]
     assert any("tiles/N50_E020/lossyear.tif" in key for _, key in calls["put"])
     assert any("tiles/N50_E020/treecover2000.tif" in key for _, key in calls["put"])
-    assert any("manifests/test_aoi/tiles_manifest.json" in key for _, key in calls["put"])
\ No newline at end of file
+    assert any("manifests/test_aoi/tiles_manifest.json" in key for _, key in calls["put"])
+
+
+def test_minio_client_is_reused_per_config(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("MINIO_ENDPOINT", "https://minio.local")
+    monkeypatch.setenv("MINIO_ACCESS_KEY", "access")
+    monkeypatch.setenv("MINIO_SECRET_KEY", "secret")
+    monkeypatch.delenv("MINIO_SECURE", raising=False)
+    minio_cache._cached_client.cache_clear()
+
+    client = minio_cache._client_from_env()
+    assert minio_cache._client_from_env() is client
+    assert minio_cache._client_for("https://minio.local", "access", "secret") is client
+
+    monkeypatch.setenv("MINIO_SECURE", "0")
+    assert minio_cache._client_from_env() is not client
+
+
+def test_ranged_download_reassembles_object(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    payload = bytes(range(256)) * 41  # not a multiple of the range size
+    monkeypatch.setattr(minio_cache, "_RANGE_SIZE", 1000)
+    monkeypatch.setenv("MINIO_PART_CONCURRENCY", "4")
+
+    class _Response:
+        def __init__(self, data: bytes) -> None:
+            self._data = data
+
+        def stream(self, amt: int):
+            for start in range(0, len(self._data), 300):
+                yield self._data[start : start + 300]
+
+        def close(self) -> None:
+            pass
+
+        def release_conn(self) -> None:
+            pass
+
+    class _Client:
+        def get_object(self, bucket: str, key: str, offset: int = 0, length: int = 0) -> _Response:
+            return _Response(payload[offset : offset + length])
+
+    dest = tmp_path / "tile" / "lossyear.tif"
+    dest.parent.mkdir()
+    minio_cache._fget_ranged(_Client(), "cache", "key", dest, len(payload))
+
+    assert dest.read_bytes() == payload
+    assert sorted(p.name for p in dest.parent.iterdir()) == ["lossyear.tif"]
+
+
+@pytest.mark.parametrize("range_size, expected_call", [(1 << 20, "fget"), (1000, "get")])
+def test_get_file_if_exists_picks_download_path(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, range_size: int, expected_call: str
+) -> None:
+    payload = bytes(range(256)) * 41
+    monkeypatch.setattr(minio_cache, "_RANGE_SIZE", range_size)
+    monkeypatch.setenv("MINIO_PART_CONCURRENCY", "4")
+    calls: list[str] = []
+
+    class _Response:
+        def __init__(self, data: bytes) -> None:
+            self._data = data
+
+        def stream(self, amt: int):
+            yield self._data
+
+        def close(self) -> None:
+            pass
+
+        def release_conn(self) -> None:
+            pass
+
+    class _Client:
+        def stat_object(self, bucket: str, key: str) -> SimpleNamespace:
+            sha256 = hashlib.sha256(payload).hexdigest()
+            return SimpleNamespace(size=len(payload), metadata={"x-amz-meta-sha256": sha256})
+
+        def fget_object(self, bucket: str, key: str, file_path: str) -> None:
+            calls.append("fget")
+            Path(file_path).write_bytes(payload)
+
+        def get_object(self, bucket: str, key: str, offset: int = 0, length: int = 0) -> _Response:
+            calls.append("get")
+            return _Response(payload[offset : offset + length])
+
+    monkeypatch.setattr(minio_cache, "_client_from_env", lambda: _Client())
+
+    dest = tmp_path / "tile" / "lossyear.tif"
+    assert minio_cache.get_file_if_exists("cache", "key", dest)
+    assert dest.read_bytes() == payload
+    assert set(calls) == {expected_call}
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pytest
+import rasterio
+from rasterio.transform import from_origin
+
+from eudr_dmi_gil.analysis.hansen_parcels import compute_hansen_parcel_stats
+from eudr_dmi_gil.geo.forest_area_core import pixel_area_m2_raster
+
+_TRANSFORM = from_origin(24.0, 58.02, 0.001, 0.001)
+
+
+@dataclass(frozen=True)
+class _Parcel:
+    parcel_id: str
+    geometry: dict
+
+
+def _box(x0: float, y0: float, x1: float, y1: float) -> dict:
+    return {
+        "type": "Polygon",
+        "coordinates": [[[x0, y0], [x1, y0], [x1, y1], [x0, y1], [x0, y0]]],
+    }
+
+
+def _write_test_raster(path: Path, data: np.ndarray, transform) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with rasterio.open(
+        path,
+        "w",
+        driver="GTiff",
+        height=data.shape[0],
+        width=data.shape[1],
+        count=1,
+        dtype=data.dtype,
+        crs="EPSG:4326",
+        transform=transform,
+        nodata=255,
+    ) as dst:
+        dst.write(data, 1)
+
+
+def _write_tiles(tile_dir: Path) -> None:
+    treecover = np.full((20, 20), 50, dtype=np.uint8)
+    treecover[:, 15:] = 10
+    treecover[19, 0:10] = 255
+    lossyear = np.zeros((20, 20), dtype=np.uint8)
+    lossyear[0:5, 0:5] = 22
+    lossyear[0:5, 5:10] = 18
+    _write_test_raster(tile_dir / "treecover2000.tif", treecover, _TRANSFORM)
+    _write_test_raster(tile_dir / "lossyear.tif", lossyear, _TRANSFORM)
+
+
+def _area_ha(rows: slice, cols: slice) -> float:
+    area_m2 = pixel_area_m2_raster(_TRANSFORM, height=20, width=20, crs="EPSG:4326")
+    return float(area_m2[rows, cols].sum()) / 10_000.0
+
+
+def _stats(tile_dir: Path, parcels: list[_Parcel]) -> dict[str, tuple[float, float, float]]:
+    result = compute_hansen_parcel_stats(
+        parcels=parcels,
+        tile_dir=tile_dir,
+        canopy_threshold_percent=30,
+        end_year=2024,
+        reproject_to_projected=False,
+    )
+    return {
+        parcel_id: (
+            stat.hansen_land_area_ha,
+            stat.hansen_forest_area_ha,
+            stat.hansen_forest_loss_ha,
+        )
+        for parcel_id, stat in result.items()
+    }
+
+
+def test_compute_hansen_parcel_stats_per_parcel_areas(tmp_path: Path) -> None:
+    _write_tiles(tmp_path)
+    west = _Parcel("west", _box(24.0, 58.0, 24.01, 58.02))
+    east = _Parcel("east", _box(24.01, 58.0, 24.02, 58.02))
+    outside = _Parcel("outside", _box(30.0, 50.0, 30.1, 50.1))
+
+    stats = _stats(tmp_path, [west, east, outside])
+
+    # The bottom row of "west" is nodata; its top five rows were lost, 2018 on
+    # the right half (before the cutoff) and 2022 on the left half.
+    assert stats["west"] == pytest.approx(
+        (
+            _area_ha(slice(0, 19), slice(0, 10)),
+            _area_ha(slice(5, 19), slice(0, 10)),
+            _area_ha(slice(0, 5), slice(0, 5)),
+        )
+    )
+    # Half of "east" falls below the canopy threshold.
+    assert stats["east"] == pytest.approx(
+        (_area_ha(slice(0, 20), slice(10, 20)), _area_ha(slice(0, 20), slice(10, 15)), 0.0)
+    )
+    assert stats["outside"] == (0.0, 0.0, 0.0)
+
+
+def test_compute_hansen_parcel_stats_overlapping_parcels(tmp_path: Path) -> None:
+    _write_tiles(tmp_path)
+    west = _Parcel("west", _box(24.0, 58.0, 24.01, 58.02))
+    north = _Parcel("north", _box(24.0, 58.01, 24.02, 58.02))
+
+    stats = _stats(tmp_path, [west, north])
+
+    assert stats["west"] == pytest.approx(_stats(tmp_path, [west])["west"])
+    assert stats["north"] == pytest.approx(_stats(tmp_path, [north])["north"])
+    assert stats["north"][0] == pytest.approx(_area_ha(slice(0, 10), slice(0, 20)))
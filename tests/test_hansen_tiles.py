@@ -5,9 +5,11 @@ from pathlib import Path
 from eudr_dmi_gil.deps.hansen_acquire import infer_hansen_latest_year
 from eudr_dmi_gil.deps.hansen_tiles import hansen_tile_ids_for_bbox, load_aoi_bbox
 
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+
 
 def test_hansen_tile_ids_for_estonia_fixture() -> None:
-    aoi_path = Path(__file__).resolve().parents[1] / "aoi_json_examples" / "estonia_testland1.geojson"
+    aoi_path = _REPO_ROOT / "aoi_json_examples" / "estonia_testland1.geojson"
     bbox = load_aoi_bbox(aoi_path)
     tile_ids = hansen_tile_ids_for_bbox(bbox)
 
@@ -1,12 +1,21 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import subprocess
 import sys
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
 from pathlib import Path
 
+import pytest
+
+from eudr_dmi.reports import io as report_io
 from eudr_dmi.reports.build_report import build_report_v1
 
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+
 
 def _write_demo_geojson(path: Path) -> None:
     payload = {
@@ -64,10 +73,9 @@ def test_generated_out_structure_exists(tmp_path: Path) -> None:
     geojson_path = tmp_path / "demo.geojson"
     _write_demo_geojson(geojson_path)
 
-    repo_root = Path(__file__).resolve().parents[1]
     cmd = [
         sys.executable,
-        str(repo_root / "scripts" / "generate_report_v1.py"),
+        str(_REPO_ROOT / "scripts" / "generate_report_v1.py"),
         "--run-id",
         "demo_2026-02-20",
         "--plot-id",
@@ -77,8 +85,8 @@ def test_generated_out_structure_exists(tmp_path: Path) -> None:
         "--out-dir",
         str(tmp_path / "out" / "reports"),
     ]
-    proc = subprocess.run(cmd, text=True, capture_output=True, check=False)
-    assert proc.returncode == 0, proc.stderr
+    proc = subprocess.run(cmd, capture_output=True, check=False)
+    assert proc.returncode == 0, proc.stderr.decode("utf-8", "replace")
 
     out = tmp_path / "out" / "reports" / "demo_2026-02-20" / "demo_plot_01"
     assert (out / "report.json").is_file()
@@ -91,10 +99,9 @@ def test_manifest_has_three_entries(tmp_path: Path) -> None:
     geojson_path = tmp_path / "demo.geojson"
     _write_demo_geojson(geojson_path)
 
-    repo_root = Path(__file__).resolve().parents[1]
     cmd = [
         sys.executable,
-        str(repo_root / "scripts" / "generate_report_v1.py"),
+        str(_REPO_ROOT / "scripts" / "generate_report_v1.py"),
         "--run-id",
         "demo_2026-02-20",
         "--plot-id",
@@ -104,8 +111,8 @@ def test_manifest_has_three_entries(tmp_path: Path) -> None:
         "--out-dir",
         str(tmp_path / "out" / "reports"),
     ]
-    proc = subprocess.run(cmd, text=True, capture_output=True, check=False)
-    assert proc.returncode == 0, proc.stderr
+    proc = subprocess.run(cmd, capture_output=True, check=False)
+    assert proc.returncode == 0, proc.stderr.decode("utf-8", "replace")
 
     manifest = (
         tmp_path
@@ -195,10 +202,9 @@ def test_generate_report_with_analysis_writes_static_map_svg(tmp_path: Path) ->
     }
     analysis_path.write_text(json.dumps(analysis_payload), encoding="utf-8")
 
-    repo_root = Path(__file__).resolve().parents[1]
     cmd = [
         sys.executable,
-        str(repo_root / "scripts" / "generate_report_v1.py"),
+        str(_REPO_ROOT / "scripts" / "generate_report_v1.py"),
         "--run-id",
         "demo_2026-02-20",
         "--plot-id",
@@ -210,8 +216,8 @@ def test_generate_report_with_analysis_writes_static_map_svg(tmp_path: Path) ->
         "--out-dir",
         str(tmp_path / "out" / "reports"),
     ]
-    proc = subprocess.run(cmd, text=True, capture_output=True, check=False)
-    assert proc.returncode == 0, proc.stderr
+    proc = subprocess.run(cmd, capture_output=True, check=False)
+    assert proc.returncode == 0, proc.stderr.decode("utf-8", "replace")
 
     out = tmp_path / "out" / "reports" / "demo_2026-02-20" / "demo_plot_01"
     assert (out / "deforestation_map.svg").is_file()
@@ -220,3 +226,49 @@ def test_generate_report_with_analysis_writes_static_map_svg(tmp_path: Path) ->
     assert "deforestation_map.svg" in report_payload["deforestation_assessment"]["evidence_maps"]
     assert "deforestation_map.svg" in report_payload["artifacts"]
     assert "deforestation_map.png" in report_payload["artifacts"]
+
+
+def test_write_json_stable_bytes_do_not_depend_on_orjson(tmp_path: Path, monkeypatch) -> None:
+    payload = {
+        "b": [1, 2.5, 1e-05, 3e16, {"label": "Loss 2021–2024"}],
+        "a": {},
+        "n": None,
+    }
+
+    report_io.write_json_stable(tmp_path / "default.json", payload)
+    monkeypatch.setattr(report_io, "_HAS_ORJSON", False)
+    report_io.write_json_stable(tmp_path / "stdlib.json", payload)
+
+    data = (tmp_path / "default.json").read_bytes()
+    assert data == (tmp_path / "stdlib.json").read_bytes()
+    assert data.endswith(b"}\n")
+
+
+@dataclass
+class _Point:
+    x: int
+
+
+@pytest.mark.parametrize(
+    "value",
+    [datetime(2026, 1, 1), _Point(1), uuid.UUID(int=1)],
+    ids=["datetime", "dataclass", "uuid"],
+)
+def test_write_json_stable_rejects_non_json_types_with_or_without_orjson(
+    tmp_path: Path, monkeypatch, value
+) -> None:
+    with pytest.raises(TypeError):
+        report_io.write_json_stable(tmp_path / "default.json", {"v": value})
+    monkeypatch.setattr(report_io, "_HAS_ORJSON", False)
+    with pytest.raises(TypeError):
+        report_io.write_json_stable(tmp_path / "stdlib.json", {"v": value})
+
+
+@pytest.mark.parametrize("content", [b"", b"manifest bytes\n" * 1000])
+def test_sha256_file_matches_hashlib(tmp_path: Path, content: bytes) -> None:
+    path = tmp_path / "artifact.bin"
+    path.write_bytes(content)
+    expected = hashlib.sha256(content).hexdigest()
+
+    assert report_io.sha256_file(path) == expected
+    assert report_io.sha256_file(path, chunk_size=7) == expected
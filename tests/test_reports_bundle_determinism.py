@@ -3,6 +3,7 @@ from __future__ import annotations
 from pathlib import Path
 
 from eudr_dmi_gil.reports.bundle import write_manifest
+from eudr_dmi_gil.reports.determinism import create_deterministic_zip
 
 
 def test_manifest_bytes_deterministic_same_inputs(tmp_path: Path) -> None:
@@ -41,3 +42,17 @@ def test_manifest_bytes_stable_ordering(tmp_path: Path) -> None:
 
     # Also ensure the file on disk matches returned bytes.
     assert (bundle_dir / "manifest.json").read_bytes() == m1
+
+
+def test_deterministic_zip_streams_paths_identically(tmp_path: Path) -> None:
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "index.html").write_text("<html></html>\n", encoding="utf-8")
+    (src / "empty.txt").write_bytes(b"")
+    (src / "tile.bin").write_bytes(bytes(range(256)) * 8192)
+    paths = {f"site/{p.name}": p for p in src.iterdir()}
+
+    create_deterministic_zip(tmp_path / "bytes.zip", {k: p.read_bytes() for k, p in paths.items()})
+    create_deterministic_zip(tmp_path / "paths.zip", paths)
+
+    assert (tmp_path / "bytes.zip").read_bytes() == (tmp_path / "paths.zip").read_bytes()
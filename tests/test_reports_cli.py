@@ -5,25 +5,35 @@ import json
 import re
 import subprocess
 import sys
-from datetime import datetime, timezone
+from datetime import datetime
 from pathlib import Path
 
 import numpy as np
+import pytest
 import rasterio
 from rasterio.transform import from_bounds
 
 from eudr_dmi_gil.reports.validate import validate_aoi_report_file
 
-
-def _run_cli(args: list[str], *, env: dict[str, str]) -> subprocess.CompletedProcess[str]:
-    repo_root = Path(__file__).resolve().parents[1]
-    src_path = str(repo_root / "src")
-    env = dict(env)
-    env["PYTHONPATH"] = src_path + (":" + env["PYTHONPATH"] if env.get("PYTHONPATH") else "")
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+_HREF_RE = re.compile(r'href="([^"]+)"')
+
+
+def _run_cli(
+    args: list[str], *, env: dict[str, str] | None = None
+) -> subprocess.CompletedProcess[bytes]:
+    src_path = str(_REPO_ROOT / "src")
+    pythonpath = os.environ.get("PYTHONPATH")
+    # Inherit the parent environment (GDAL/PROJ data, library paths, venv) and
+    # overlay only what the test sets.
+    env = {
+        **os.environ,
+        "PYTHONPATH": src_path + (os.pathsep + pythonpath if pythonpath else ""),
+        **(env or {}),
+    }
     return subprocess.run(
         [sys.executable, "-m", "eudr_dmi_gil.reports.cli", *args],
         check=False,
-        text=True,
         capture_output=True,
         env=env,
     )
@@ -45,16 +55,18 @@ def _write_test_raster(path: Path, data: np.ndarray, transform, crs: str) -> Non
 
 
 def test_cli_help() -> None:
-    proc = _run_cli(["--help"], env=os.environ.copy())
+    proc = _run_cli(["--help"])
     assert proc.returncode == 0
-    assert "Generate a deterministic AOI report bundle" in proc.stdout
+    assert b"Generate a deterministic AOI report bundle" in proc.stdout
 
 
+@pytest.mark.slow
 def test_cli_golden_run_creates_bundle(tmp_path: Path) -> None:
     evidence_root = tmp_path / "evidence"
-    env = os.environ.copy()
-    env["EUDR_DMI_EVIDENCE_ROOT"] = str(evidence_root)
-    env["EUDR_DMI_GENERATED_AT_UTC"] = "2026-02-19T12:47:49+00:00"
+    env = {
+        "EUDR_DMI_EVIDENCE_ROOT": str(evidence_root),
+        "EUDR_DMI_GENERATED_AT_UTC": "2026-02-19T12:47:49+00:00",
+    }
 
     bundle_id = "bundle-001"
     aoi_id = "aoi-123"
@@ -87,7 +99,7 @@ def test_cli_golden_run_creates_bundle(tmp_path: Path) -> None:
         env=env,
     )
 
-    assert proc.returncode == 0, proc.stderr
+    assert proc.returncode == 0, proc.stderr.decode("utf-8", "replace")
 
     bundle_date = "2026-02-19"
     bundle_dir = evidence_root / bundle_date / bundle_id
@@ -134,7 +146,7 @@ def test_cli_golden_run_creates_bundle(tmp_path: Path) -> None:
 
     # HTML links should be portable (no absolute paths, no schemes).
     html = report_html.read_text(encoding="utf-8")
-    hrefs = re.findall(r'href="([^"]+)"', html)
+    hrefs = _HREF_RE.findall(html)
     assert hrefs, "expected at least one link"
     for href in hrefs:
         if href.startswith("https://unpkg.com/leaflet@"):  # external Leaflet assets
@@ -149,10 +161,13 @@ def test_cli_golden_run_creates_bundle(tmp_path: Path) -> None:
     assert f"reports/aoi_report_v2/{aoi_id}/metrics.csv" in relpaths
 
 
-def test_cli_hansen_external_dependencies(tmp_path: Path) -> None:
+@pytest.mark.slow
+def test_cli_hansen_external_dependencies(tmp_path: Path, frozen_utc_now: datetime) -> None:
     evidence_root = tmp_path / "evidence"
-    env = os.environ.copy()
-    env["EUDR_DMI_EVIDENCE_ROOT"] = str(evidence_root)
+    env = {
+        "EUDR_DMI_EVIDENCE_ROOT": str(evidence_root),
+        "EUDR_DMI_GENERATED_AT_UTC": frozen_utc_now.isoformat(),
+    }
 
     bundle_id = "bundle-hansen-001"
     aoi_id = "aoi-456"
@@ -210,10 +225,9 @@ def test_cli_hansen_external_dependencies(tmp_path: Path) -> None:
         env=env,
     )
 
-    assert proc.returncode == 0, proc.stderr
+    assert proc.returncode == 0, proc.stderr.decode("utf-8", "replace")
 
-    bundle_date = datetime.now(timezone.utc).date().strftime("%Y-%m-%d")
-    bundle_dir = evidence_root / bundle_date / bundle_id
+    bundle_dir = evidence_root / frozen_utc_now.date().isoformat() / bundle_id
     report_json = bundle_dir / "reports" / "aoi_report_v2" / f"{aoi_id}.json"
     report = json.loads(report_json.read_text(encoding="utf-8"))
 
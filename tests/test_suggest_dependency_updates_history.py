@@ -1,21 +1,13 @@
 from __future__ import annotations
 
 import csv
-import importlib.util
 import json
 from pathlib import Path
 from types import SimpleNamespace
 
 import pytest
 
-
-def _load_script_module(path: Path, name: str):
-    spec = importlib.util.spec_from_file_location(name, path)
-    if spec is None or spec.loader is None:
-        raise RuntimeError(f"Unable to load module: {path}")
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
-    return module
+_REPO_ROOT = Path(__file__).resolve().parents[1]
 
 
 class FakeResponse:
@@ -32,10 +24,9 @@ class FakeResponse:
         return b""
 
 
-def test_suggest_dependency_updates_history(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-    script_repo = Path(__file__).resolve().parents[1]
-    suggest_updates = _load_script_module(
-        script_repo / "scripts" / "suggest_dependency_updates.py",
+def test_suggest_dependency_updates_history(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, script_loader) -> None:
+    suggest_updates = script_loader(
+        _REPO_ROOT / "scripts" / "suggest_dependency_updates.py",
         "suggest_dependency_updates",
     )
 
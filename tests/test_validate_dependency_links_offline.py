@@ -1,20 +1,14 @@
 from __future__ import annotations
 
+import http.server
 import json
+import threading
 from pathlib import Path
 from types import SimpleNamespace
-import importlib.util
 
 import pytest
 
-
-def _load_script_module(path: Path, name: str):
-    spec = importlib.util.spec_from_file_location(name, path)
-    if spec is None or spec.loader is None:
-        raise RuntimeError(f"Unable to load module: {path}")
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
-    return module
+_REPO_ROOT = Path(__file__).resolve().parents[1]
 
 
 class FakeResponse:
@@ -31,10 +25,9 @@ class FakeResponse:
         return b""
 
 
-def test_validate_dependency_links_offline(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-    script_repo = Path(__file__).resolve().parents[1]
-    validate_dependency_links = _load_script_module(
-        script_repo / "scripts" / "validate_dependency_links.py",
+def test_validate_dependency_links_offline(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, script_loader) -> None:
+    validate_dependency_links = script_loader(
+        _REPO_ROOT / "scripts" / "validate_dependency_links.py",
         "validate_dependency_links",
     )
 
@@ -69,7 +62,7 @@ def test_validate_dependency_links_offline(tmp_path: Path, monkeypatch: pytest.M
         encoding="utf-8",
     )
 
-    def fake_urlopen(request, timeout=0):  # noqa: ANN001
+    def fake_urlopen(request, timeout=0):
         method = request.get_method()
         url = request.full_url
         if url.endswith("/a"):
@@ -85,6 +78,7 @@ def test_validate_dependency_links_offline(tmp_path: Path, monkeypatch: pytest.M
         return FakeResponse(status=206, url=url, headers={"Content-Type": "application/json"})
 
     monkeypatch.setattr(validate_dependency_links, "repo_root", lambda: repo_root)
+    monkeypatch.setattr(validate_dependency_links, "_POOL", None)
     monkeypatch.setattr(validate_dependency_links.urllib.request, "urlopen", fake_urlopen)
 
     out_path = repo_root / "out" / "dependency_link_check.json"
@@ -104,3 +98,199 @@ def test_validate_dependency_links_offline(tmp_path: Path, monkeypatch: pytest.M
     ids = [entry["dependency_id"] for entry in data["results"]]
     assert ids == ["a_dep", "b_dep"]
     assert all("checked_at_utc" not in entry for entry in data["results"])
+    # Byte-identical to the stdlib writer whether or not orjson is installed.
+    expected = json.dumps(data, indent=2, sort_keys=True) + "\n"
+    assert out_path.read_bytes() == expected.encode("utf-8")
+
+
+class FakePooledResponse:
+    def __init__(self, *, status: int, redirect_to: str, headers: dict[str, str]) -> None:
+        self.status = status
+        self.headers = headers
+        self.length_remaining = 0
+        self.retries = SimpleNamespace(history=(SimpleNamespace(redirect_location=redirect_to),))
+        self.released = False
+
+    def read(self, _size: int = -1) -> bytes:
+        return b""
+
+    def drain_conn(self) -> None:
+        return None
+
+    def close(self) -> None:
+        return None
+
+    def release_conn(self) -> None:
+        self.released = True
+
+
+def test_validate_dependency_links_pooled_transport(monkeypatch: pytest.MonkeyPatch, script_loader) -> None:
+    validate_dependency_links = script_loader(
+        _REPO_ROOT / "scripts" / "validate_dependency_links.py",
+        "validate_dependency_links",
+    )
+
+    calls: list[tuple[str, str, dict[str, str]]] = []
+    responses: list[FakePooledResponse] = []
+
+    class FakePool:
+        def request(self, method, url, headers=None, preload_content=True):
+            calls.append((method, url, dict(headers or {})))
+            status = 405 if method == "HEAD" else 206
+            response = FakePooledResponse(
+                status=status, redirect_to="/c/final", headers={"Content-Type": "text/csv"}
+            )
+            responses.append(response)
+            return response
+
+    monkeypatch.setattr(validate_dependency_links, "_POOL", FakePool())
+
+    status, final_url, headers = validate_dependency_links._check_url("https://example.org/c")
+    assert (status, final_url) == (206, "https://example.org/c/final")
+    assert headers == {"content-type": "text/csv"}
+    assert [c[0] for c in calls] == ["HEAD", "GET"]
+    assert calls[1][2] == {"Range": "bytes=0-1024"}
+    assert all(r.released for r in responses)
+
+
+
+def test_validate_dependency_links_follows_redirect_chain(script_loader) -> None:
+    validate_dependency_links = script_loader(
+        _REPO_ROOT / "scripts" / "validate_dependency_links.py",
+        "validate_dependency_links",
+    )
+    if validate_dependency_links._POOL is None:
+        pytest.skip("urllib3 not installed")
+
+    # /a -> /b -> /c: more hops than RETRIES, which must not exhaust the budget.
+    redirects = {"/a": "/b", "/b": "/c"}
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_HEAD(self) -> None:
+            target = redirects.get(self.path)
+            self.send_response(302 if target else 200)
+            if target:
+                self.send_header("Location", target)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *args) -> None:
+            return None
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        base = f"http://127.0.0.1:{server.server_address[1]}"
+        status, final_url, _ = validate_dependency_links._check_url(f"{base}/a")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert (status, final_url) == (200, f"{base}/c")
+
+def test_validate_dependency_links_replays_validators(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, script_loader
+) -> None:
+    validate_dependency_links = script_loader(
+        _REPO_ROOT / "scripts" / "validate_dependency_links.py",
+        "validate_dependency_links",
+    )
+
+    docs = tmp_path / "docs" / "dependencies"
+    docs.mkdir(parents=True, exist_ok=True)
+    (docs / "sources.json").write_text(
+        json.dumps(
+            {
+                "sources": [
+                    {
+                        "id": "a_dep",
+                        "url": "https://example.org/a",
+                        "expected_content_type": "text/html",
+                    }
+                ]
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    seen_headers: list[dict[str, str]] = []
+
+    def fake_urlopen(request, timeout=0):
+        headers = {k.lower(): v for k, v in request.header_items()}
+        seen_headers.append(headers)
+        if headers.get("if-none-match") == '"v1"':
+            raise validate_dependency_links.urllib.error.HTTPError(
+                request.full_url, 304, "Not Modified", {"ETag": '"v1"'}, None
+            )
+        return FakeResponse(
+            status=200,
+            url=request.full_url,
+            headers={
+                "Content-Type": "text/html",
+                "ETag": '"v1"',
+                "Last-Modified": "Mon, 05 Jan 2026 00:00:00 GMT",
+            },
+        )
+
+    monkeypatch.setattr(validate_dependency_links, "repo_root", lambda: tmp_path)
+    monkeypatch.setattr(validate_dependency_links, "_POOL", None)
+    monkeypatch.setattr(validate_dependency_links.urllib.request, "urlopen", fake_urlopen)
+
+    argv = ["--out", "out/dependency_link_check.json", "--no-timestamps", "--fail-on-broken"]
+    out_path = tmp_path / "out" / "dependency_link_check.json"
+
+    assert validate_dependency_links.main(argv) == 0
+    first = json.loads(out_path.read_text(encoding="utf-8"))["results"][0]
+    assert first["etag"] == '"v1"'
+    assert "if-none-match" not in seen_headers[0]
+
+    assert validate_dependency_links.main(argv) == 0
+    second = json.loads(out_path.read_text(encoding="utf-8"))["results"][0]
+    assert seen_headers[1]["if-none-match"] == '"v1"'
+    assert seen_headers[1]["if-modified-since"] == "Mon, 05 Jan 2026 00:00:00 GMT"
+    assert second["http_status"] == 304
+    assert second["ok"] is True
+    assert second["content_type_match"] is True
+    assert second["last_modified"] == first["last_modified"]
+
+
+def test_validate_dependency_links_checks_shared_url_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, script_loader
+) -> None:
+    validate_dependency_links = script_loader(
+        _REPO_ROOT / "scripts" / "validate_dependency_links.py",
+        "validate_dependency_links",
+    )
+
+    docs = tmp_path / "docs" / "dependencies"
+    docs.mkdir(parents=True, exist_ok=True)
+    shared = "https://example.org/shared"
+    (docs / "sources.json").write_text(
+        json.dumps(
+            {
+                "sources": [
+                    {"id": "b_dep", "url": shared, "expected_content_type": "text/html"},
+                    {"id": "a_dep", "url": shared, "expected_content_type": "application/pdf"},
+                ]
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    requested: list[str] = []
+
+    def fake_urlopen(request, timeout=0):
+        requested.append(request.full_url)
+        return FakeResponse(status=200, url=request.full_url, headers={"Content-Type": "text/html"})
+
+    monkeypatch.setattr(validate_dependency_links, "repo_root", lambda: tmp_path)
+    monkeypatch.setattr(validate_dependency_links, "_POOL", None)
+    monkeypatch.setattr(validate_dependency_links.urllib.request, "urlopen", fake_urlopen)
+
+    assert validate_dependency_links.main(["--no-timestamps"]) == 0
+
+    assert requested == [shared]
+    data = json.loads((tmp_path / "out" / "dependency_link_check.json").read_text(encoding="utf-8"))
+    assert [entry["dependency_id"] for entry in data["results"]] == ["a_dep", "b_dep"]
+    assert [entry["content_type_match"] for entry in data["results"]] == [False, True]